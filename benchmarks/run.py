@@ -0,0 +1,220 @@
+"""Offline replay benchmarks for end-to-end validation.
+
+Runs `validate_all` against replayed AWS responses at several inventory
+sizes and records throughput, peak memory and report-writing time as JSON.
+Each size runs in its own process so peak memory is measured in isolation.
+
+Usage:
+    python -m benchmarks.run --sizes 100,10000,1000000 --output bench.json
+    python -m benchmarks.run --sizes 10000 --compare bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from queue import Empty
+from typing import Any, Dict, List, Optional
+
+from src.report.generator import ReportGenerator
+from src.validators.aws_validator import AWSValidator
+from .replay import ReplayProvider, load_recording
+
+
+DEFAULT_SIZES = [100, 10_000, 1_000_000]
+
+# Share of the inventory given to each service
+INVENTORY_MIX = {'s3': 0.5, 'dynamodb': 0.3, 'rds': 0.2}
+
+
+def build_inventory(size: int):
+    """Build synthetic resource identifiers for an inventory size.
+
+    Returns:
+        Tuple of (bucket names, database IDs, database types by ID).
+    """
+    s3_count = int(size * INVENTORY_MIX['s3'])
+    dynamodb_count = int(size * INVENTORY_MIX['dynamodb'])
+    rds_count = size - s3_count - dynamodb_count
+
+    buckets = [f"bench-bucket-{i}" for i in range(s3_count)]
+    database_types = {f"bench-table-{i}": 'dynamodb' for i in range(dynamodb_count)}
+    database_types.update({f"bench-db-{i}": 'rds' for i in range(rds_count)})
+    return buckets, list(database_types), database_types
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(size: int, latency_ms: float, throttle_rate: float,
+             recording: Optional[str], seed: int) -> Dict[str, Any]:
+    """Run one benchmark case and return its measurements."""
+    buckets, database_ids, database_types = build_inventory(size)
+    responses = load_recording(recording) if recording else None
+
+    validator = AWSValidator(region_name='us-east-1')
+    validator.aws = ReplayProvider(responses, latency=latency_ms / 1000.0,
+                                   throttle_rate=throttle_rate, seed=seed)
+
+    start = time.perf_counter()
+    result = validator.validate_all(
+        object_storage_ids=buckets,
+        database_ids=database_ids,
+        db_type=lambda db_id: database_types.get(db_id, 'dynamodb')
+    )
+    validate_seconds = time.perf_counter() - start
+
+    report_seconds = {}
+    generator = ReportGenerator(output_dir=tempfile.mkdtemp(prefix='fedramp-bench-'))
+    for report, generate in (('json', generator.generate_json),
+                             ('csv', generator.generate_csv),
+                             ('summary', generator.generate_summary)):
+        start = time.perf_counter()
+        generate(result)
+        report_seconds[report] = round(time.perf_counter() - start, 6)
+
+    return {
+        'size': size,
+        'latency_ms': latency_ms,
+        'throttle_rate': throttle_rate,
+        'validate_seconds': round(validate_seconds, 6),
+        'resources_per_second': round(size / validate_seconds, 1) if validate_seconds else None,
+        'locations': len(result.storage_locations),
+        'errors': len(result.errors),
+        'api_calls': sum(client.calls for client in validator.aws._clients.values()),
+        'report_seconds': report_seconds,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def _run_case_in_child(queue, *args) -> None:
+    try:
+        queue.put(run_case(*args))
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+
+def run_isolated(*args, poll_interval: float = 1.0) -> Dict[str, Any]:
+    """Run a benchmark case in a fresh process.
+
+    Raises:
+        RuntimeError: If the case raised, or the process died without
+            reporting a result (e.g. killed for running out of memory).
+    """
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run_case_in_child, args=(queue,) + args)
+    process.start()
+    try:
+        while True:
+            try:
+                case = queue.get(timeout=poll_interval)
+                break
+            except Empty:
+                if not process.is_alive():
+                    # The child may have exited just after putting its result
+                    try:
+                        case = queue.get(timeout=poll_interval)
+                        break
+                    except Empty:
+                        raise RuntimeError(
+                            f"benchmark process exited with code {process.exitcode} without a result"
+                        )
+    finally:
+        process.join(timeout=poll_interval)
+        if process.is_alive():
+            process.kill()
+            process.join()
+    if 'error' in case:
+        raise RuntimeError(case['error'])
+    return case
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Compare results with a baseline run.
+
+    Returns:
+        Descriptions of cases whose throughput dropped by more than `tolerance`.
+    """
+    baseline_cases = {
+        (case['size'], case['latency_ms'], case['throttle_rate']): case
+        for case in baseline.get('results', [])
+    }
+    regressions = []
+    for case in results:
+        previous = baseline_cases.get((case['size'], case['latency_ms'], case['throttle_rate']))
+        if not previous or not previous.get('resources_per_second') or not case.get('resources_per_second'):
+            continue
+        ratio = case['resources_per_second'] / previous['resources_per_second']
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"size={case['size']}: {case['resources_per_second']} resources/s "
+                f"vs {previous['resources_per_second']} baseline ({ratio:.0%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline replay benchmarks for validate_all.")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma-separated inventory sizes.')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Latency injected into every API call, in milliseconds.')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='Fraction of API calls that fail with ThrottlingException.')
+    parser.add_argument('--recording', help='JSON file of recorded API responses per service.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for throttle injection.')
+    parser.add_argument('--output', help='File to write JSON results to. Defaults to stdout.')
+    parser.add_argument('--compare', help='Baseline JSON results to compare throughput against.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed fractional throughput drop when comparing.')
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = False
+    for size in (int(size) for size in args.sizes.split(',')):
+        try:
+            case = run_isolated(size, args.latency_ms, args.throttle_rate, args.recording, args.seed)
+        except RuntimeError as e:
+            print(f"size={size}: FAILED {e}", file=sys.stderr)
+            results.append({'size': size, 'latency_ms': args.latency_ms,
+                            'throttle_rate': args.throttle_rate, 'error': str(e)})
+            failed = True
+            continue
+        print(f"size={case['size']}: {case['resources_per_second']} resources/s, "
+              f"peak {case['peak_rss_mb']} MiB", file=sys.stderr)
+        results.append(case)
+
+    output = {
+        'generated': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    content = json.dumps(output, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(content + '\n')
+    else:
+        print(content)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions or failed else 0
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,10 +9,21 @@ import sys
 import os
 import json
 import datetime
-import boto3
+import time
 from src.main import cli
 from src.validators.aws_validator import AWSValidator
 from src.report.generator import ReportGenerator
+from src.report.uploader import S3ReportUploader
+from src.distributed.coordinator import open_result_store, process_shard
+from src.distributed.queue import Shard
+from src.checkpoint import open_checkpoint
+from src.policy.engine import load_policy
+from src.profiling import Tracer, profiling_enabled
+
+
+# Seconds reserved at the end of an invocation for flushing the checkpoint
+# and writing reports
+LAMBDA_DEADLINE_MARGIN_SECONDS = 60
 
 
 def lambda_handler(event, context):
@@ -26,78 +37,134 @@ def lambda_handler(event, context):
     Returns:
         Dict with validation results
     """
+    # Shards delivered by an SQS trigger are processed in worker mode
+    if 'Records' in event:
+        return _handle_shard_records(event)
+    
     # Get parameters from environment or event
     s3_buckets = event.get('s3_buckets', os.environ.get('S3_BUCKETS', ''))
     dynamodb_tables = event.get('dynamodb_tables', os.environ.get('DYNAMODB_TABLES', ''))
     rds_instances = event.get('rds_instances', os.environ.get('RDS_INSTANCES', ''))
     
     output_s3_bucket = event.get('output_s3_bucket', os.environ.get('OUTPUT_S3_BUCKET'))
+    checkpoint_uri = event.get('checkpoint_uri', os.environ.get('CHECKPOINT_URI'))
+    policy_name = event.get('policy', os.environ.get('POLICY'))
+    profile_sample_rate = event.get('profile_sample_rate', os.environ.get('PROFILE_SAMPLE_RATE'))
     
     # Parse comma-separated lists
     s3_bucket_list = s3_buckets.split(',') if s3_buckets else []
     dynamodb_table_list = dynamodb_tables.split(',') if dynamodb_tables else []
     rds_instance_list = rds_instances.split(',') if rds_instances else []
     
-    # Initialize validator
-    validator = AWSValidator()
+    # Sampled tracing is cheap enough to leave on in production; the trace is
+    # uploaded next to the reports
+    tracer = Tracer(sample_rate=float(profile_sample_rate)) if profile_sample_rate else None
     
-    # Track databases to validate with their type
-    database_ids = []
-    database_types = {}
-    
-    for table in dynamodb_table_list:
-        database_ids.append(table)
-        database_types[table] = 'dynamodb'
+    with profiling_enabled(tracer):
+        # Initialize validator
+        validator = AWSValidator(policy=load_policy(policy_name))
         
-    for instance in rds_instance_list:
-        database_ids.append(instance)
-        database_types[instance] = 'rds'
-    
-    # Run validation
-    result = validator.validate_all(
-        object_storage_ids=s3_bucket_list,
-        database_ids=database_ids,
-        db_type=lambda db_id: database_types.get(db_id, 'dynamodb')
-    )
-    
-    # Generate reports
-    timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-    
-    # Create a temporary directory for reports
-    import tempfile
-    temp_dir = tempfile.mkdtemp()
-    report_generator = ReportGenerator(output_dir=temp_dir)
-    
-    # Generate JSON report
-    json_path = report_generator.generate_json(result, f"encryption-validation-{timestamp}.json")
-    summary_path = report_generator.generate_summary(result, f"encryption-validation-summary-{timestamp}.txt")
+        # Track databases to validate with their type
+        database_ids = []
+        database_types = {}
+        
+        for table in dynamodb_table_list:
+            database_ids.append(table)
+            database_types[table] = 'dynamodb'
+        
+        for instance in rds_instance_list:
+            database_ids.append(instance)
+            database_types[instance] = 'rds'
+        
+        # Journal progress so a timed-out invocation can be resumed by the next
+        # one, stopping shortly before the Lambda time limit
+        checkpoint = None
+        deadline = None
+        if checkpoint_uri:
+            checkpoint = open_checkpoint(checkpoint_uri, validator.aws.get_client,
+                                         resume=bool(event.get('resume', False)))
+            if context is not None:
+                remaining = context.get_remaining_time_in_millis() / 1000.0
+                deadline = time.time() + remaining - LAMBDA_DEADLINE_MARGIN_SECONDS
+        
+        # Run validation
+        result = validator.validate_all(
+            object_storage_ids=s3_bucket_list,
+            database_ids=database_ids,
+            checkpoint=checkpoint,
+            deadline=deadline,
+            db_type=lambda db_id: database_types.get(db_id, 'dynamodb')
+        )
+        
+        # Generate reports
+        timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        json_filename = f"encryption-validation-{timestamp}.json"
+        summary_filename = f"encryption-validation-summary-{timestamp}.txt"
+        trace_filename = f"encryption-validation-trace-{timestamp}.json"
+        
+        # Stream reports straight to S3 if a bucket is specified, reusing the
+        # validator's S3 client and overlapping uploads with report rendering
+        if output_s3_bucket:
+            report_generator = ReportGenerator()
+            uploader = S3ReportUploader(validator.aws.get_client('s3'), output_s3_bucket)
+            with uploader:
+                uploader.upload(json_filename, report_generator.iter_json(result), 'application/json')
+                uploader.upload(summary_filename, report_generator.iter_summary(result), 'text/plain')
+                uploader.wait()
+                if tracer:
+                    uploader.upload(trace_filename, json.JSONEncoder().iterencode(tracer.chrome_trace()),
+                                    'application/json')
+                    uploader.wait()
+            report_location = uploader.uri_for(json_filename)
+        else:
+            import tempfile
+            report_generator = ReportGenerator(output_dir=tempfile.mkdtemp())
+            report_location = report_generator.generate_json(result, json_filename)
+            report_generator.generate_summary(result, summary_filename)
+            if tracer:
+                tracer.write_chrome_trace(os.path.join(report_generator.output_dir, trace_filename))
+        
+        # Return result
+        response = {
+            'statusCode': 200,
+            'all_encrypted': result.all_encrypted,
+            'compliant_count': sum(1 for loc in result.storage_locations if loc.compliant),
+            'non_compliant_count': sum(1 for loc in result.storage_locations if not loc.compliant),
+            'error_count': len(result.errors),
+            'complete': result.not_validated == 0,
+            'report_location': report_location
+        }
+        if tracer:
+            response['hot_spots'] = tracer.hot_spots()
+        return response
+
+
+
+def _handle_shard_records(event):
+    """
+    Process shard messages delivered by an SQS event source mapping.
     
-    # Upload reports to S3 if bucket is specified
-    if output_s3_bucket:
-        s3_client = boto3.client('s3')
+    Args:
+        event: AWS Lambda SQS event
         
-        with open(json_path, 'rb') as json_file:
-            s3_client.upload_fileobj(
-                json_file, 
-                output_s3_bucket, 
-                f"reports/encryption-validation-{timestamp}.json"
-            )
-            
-        with open(summary_path, 'rb') as summary_file:
-            s3_client.upload_fileobj(
-                summary_file, 
-                output_s3_bucket, 
-                f"reports/encryption-validation-summary-{timestamp}.txt"
-            )
+    Returns:
+        Dict with the number of shards processed
+    """
+    validator = AWSValidator(policy=load_policy(os.environ.get('POLICY')))
+    store = open_result_store(os.environ['RESULTS_URI'], validator.aws.get_client)
+    
+    processed = 0
+    for record in event['Records']:
+        shard = Shard.model_validate_json(record['body'])
+        # Redelivered shards that already have results are skipped
+        if store.has_result(shard.run_id, shard.shard_id):
+            continue
+        process_shard(validator, shard, store)
+        processed += 1
     
-    # Return result
     return {
         'statusCode': 200,
-        'all_encrypted': result.all_encrypted,
-        'compliant_count': sum(1 for loc in result.storage_locations if loc.compliant),
-        'non_compliant_count': sum(1 for loc in result.storage_locations if not loc.compliant),
-        'error_count': len(result.errors),
-        'report_location': f"s3://{output_s3_bucket}/reports/encryption-validation-{timestamp}.json" if output_s3_bucket else json_path
+        'processed_shards': processed
     }
 
 
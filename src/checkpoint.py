@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .models import StorageLocation
+
+
+DEFAULT_FLUSH_EVERY = 100
+DEFAULT_FLUSH_INTERVAL = 30.0
+
+
+def checkpoint_key(resource_type: str, resource_id: str) -> str:
+    """Get the journal key for a resource."""
+    return f"{resource_type}:{resource_id}"
+
+
+class Checkpoint(ABC):
+    """Journal of completed resources for resumable scans.
+
+    Completed locations are buffered in memory and written out in batches,
+    either every `flush_every` records or every `flush_interval` seconds,
+    so durability costs one write per batch rather than one per resource.
+    """
+
+    def __init__(self, resume: bool = False, flush_every: int = DEFAULT_FLUSH_EVERY,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """Initialize the checkpoint.
+
+        Args:
+            resume: Load previously journaled resources instead of starting fresh.
+            flush_every: Number of buffered records that triggers a write.
+            flush_interval: Seconds after which buffered records are written.
+        """
+        self.resume = resume
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._completed: Optional[Dict[str, StorageLocation]] = None
+
+    @abstractmethod
+    def _write_batch(self, lines: List[str]) -> None:
+        """Durably write a batch of journal lines."""
+        pass
+
+    @abstractmethod
+    def _read_lines(self) -> Iterator[str]:
+        """Read all previously written journal lines."""
+        pass
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Discard any previously written journal."""
+        pass
+
+    def completed(self) -> Dict[str, StorageLocation]:
+        """Get the locations completed by earlier runs, keyed by journal key.
+
+        The journal is read once; without `resume` it is discarded instead.
+        """
+        if self._completed is None:
+            self._completed = {}
+            if self.resume:
+                for line in self._read_lines():
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A crash can leave a torn final line; skip it
+                        continue
+                    self._completed[record['key']] = StorageLocation.model_validate(record['location'])
+            else:
+                self._reset()
+        return self._completed
+
+    def record(self, key: str, location: StorageLocation) -> None:
+        """Buffer a completed location, writing the buffer out when due."""
+        line = json.dumps({'key': key, 'location': location.model_dump(mode='json')})
+        with self._lock:
+            self._buffer.append(line)
+            due = (len(self._buffer) >= self.flush_every
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered records."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if lines:
+                self._write_batch(lines)
+
+
+class LocalCheckpoint(Checkpoint):
+    """Checkpoint journal stored as an NDJSON file on local disk."""
+
+    def __init__(self, path: str, **kwargs):
+        """Initialize the checkpoint.
+
+        Args:
+            path: Path to the journal file.
+            **kwargs: Arguments passed to `Checkpoint`.
+        """
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._tail_checked = False
+
+    def _truncate_torn_line(self) -> None:
+        """Drop a partial final line left by a crash, so new records start on a fresh line."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+            f.seek(0)
+            data = f.read()
+            f.truncate(data.rfind(b'\n') + 1)
+
+    def _write_batch(self, lines: List[str]) -> None:
+        if not self._tail_checked:
+            self._truncate_torn_line()
+            self._tail_checked = True
+        with open(self.path, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_lines(self) -> Iterator[str]:
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            yield from f
+
+    def _reset(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+
+class S3Checkpoint(Checkpoint):
+    """Checkpoint journal stored as NDJSON segments under an S3 prefix.
+
+    S3 objects cannot be appended to, so each flushed batch is written as
+    its own segment object.
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, prefix: str = "", **kwargs):
+        """Initialize the checkpoint.
+
+        Args:
+            s3_client: boto3 S3 client.
+            bucket: Bucket holding the journal.
+            prefix: Key prefix for journal segments.
+            **kwargs: Arguments passed to `Checkpoint`.
+        """
+        super().__init__(**kwargs)
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix.rstrip('/') + '/' if prefix else ''
+
+    def _segment_keys(self) -> Iterator[str]:
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=f"{self.prefix}segment-"):
+            for obj in page.get('Contents', []):
+                yield obj['Key']
+
+    def _write_batch(self, lines: List[str]) -> None:
+        key = f"{self.prefix}segment-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.ndjson"
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=('\n'.join(lines) + '\n').encode('utf-8')
+        )
+
+    def _read_lines(self) -> Iterator[str]:
+        for key in self._segment_keys():
+            body = self.s3_client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+            yield from body.decode('utf-8').splitlines()
+
+    def _reset(self) -> None:
+        for key in list(self._segment_keys()):
+            self.s3_client.delete_object(Bucket=self.bucket, Key=key)
+
+
+def open_checkpoint(uri: str, client_factory: Callable[[str], Any], **kwargs) -> Checkpoint:
+    """Open a checkpoint journal from a URI.
+
+    Args:
+        uri: `s3://bucket/prefix` URI, or a local file path.
+        client_factory: Callable returning a boto3 client for a service name.
+        **kwargs: Arguments passed to the checkpoint.
+
+    Returns:
+        The checkpoint journal.
+    """
+    if uri.startswith('s3://'):
+        bucket, _, prefix = uri[len('s3://'):].partition('/')
+        return S3Checkpoint(client_factory('s3'), bucket, prefix, **kwargs)
+    return LocalCheckpoint(uri, **kwargs)
@@ -0,0 +1,226 @@
+import datetime
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..models import ValidationResult
+from ..validators.base import BaseValidator
+from .queue import Shard, ShardQueue, SQLiteShardQueue, SQSShardQueue
+from .store import LocalResultStore, ResultStore, S3ResultStore
+
+
+DEFAULT_SHARD_SIZE = 200
+
+
+def new_run_id() -> str:
+    """Generate a unique, time-ordered ID for a scan run."""
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+
+def make_shards(run_id: str, object_storage_ids: List[str], database_ids: List[str],
+                database_types: Dict[str, str], shard_size: int = DEFAULT_SHARD_SIZE) -> List[Shard]:
+    """Split resources into shards of at most `shard_size` resources.
+
+    Args:
+        run_id: ID of the scan run the shards belong to.
+        object_storage_ids: Object storage identifiers.
+        database_ids: Database identifiers.
+        database_types: Mapping of database identifier to database type.
+        shard_size: Maximum number of resources per shard.
+
+    Returns:
+        List of shards covering every resource exactly once.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    resources = [('object_storage', storage_id) for storage_id in object_storage_ids]
+    resources += [('database', db_id) for db_id in database_ids]
+
+    shards = []
+    for start in range(0, len(resources), shard_size):
+        chunk = resources[start:start + shard_size]
+        shards.append(Shard.create(
+            run_id=run_id,
+            object_storage_ids=[rid for kind, rid in chunk if kind == 'object_storage'],
+            database_ids=[rid for kind, rid in chunk if kind == 'database'],
+            database_types=database_types
+        ))
+    return shards
+
+
+def coordinate(queue: ShardQueue, store: ResultStore, object_storage_ids: List[str],
+               database_ids: List[str], database_types: Dict[str, str],
+               shard_size: int = DEFAULT_SHARD_SIZE, run_id: Optional[str] = None) -> List[Shard]:
+    """Shard the resources, record a manifest and enqueue the shards.
+
+    Each call starts a new scan run unless `run_id` is given, so repeat
+    scans of the same resources are validated again.
+
+    Args:
+        queue: Queue to write shards to.
+        store: Result store workers will write to.
+        object_storage_ids: Object storage identifiers.
+        database_ids: Database identifiers.
+        database_types: Mapping of database identifier to database type.
+        shard_size: Maximum number of resources per shard.
+        run_id: Optional ID of the run to add the shards to. Defaults to a
+            new run.
+
+    Returns:
+        The enqueued shards.
+    """
+    run_id = run_id or new_run_id()
+    shards = make_shards(run_id, object_storage_ids, database_ids, database_types, shard_size)
+    # Write the manifest first so the reducer can detect missing shards
+    store.put_manifest(run_id, [shard.shard_id for shard in shards])
+    for shard in shards:
+        queue.put(shard)
+    return shards
+
+
+def process_shard(validator: BaseValidator, shard: Shard, store: ResultStore) -> ValidationResult:
+    """Validate a single shard and store its partial result.
+
+    Args:
+        validator: Validator to scan the shard's resources with.
+        shard: Shard to process.
+        store: Result store to write the partial result to.
+
+    Returns:
+        The shard's partial result.
+    """
+    validator.result = ValidationResult()
+    result = validator.validate_all(
+        object_storage_ids=shard.object_storage_ids,
+        database_ids=shard.database_ids,
+        db_type=lambda db_id: shard.database_types.get(db_id, 'dynamodb')
+    )
+    store.put_result(shard.run_id, shard.shard_id, result)
+    return result
+
+
+def run_worker(validator: BaseValidator, queue: ShardQueue, store: ResultStore,
+               max_shards: Optional[int] = None, visibility_timeout: int = 900) -> int:
+    """Process shards from the queue until it is drained.
+
+    Shards that already have a stored result (duplicate deliveries or
+    retries after a lost ack) are acknowledged without being rescanned.
+
+    Args:
+        validator: Validator to scan resources with.
+        queue: Queue to take shards from.
+        store: Result store to write partial results to.
+        max_shards: Optional limit on the number of shards to process.
+        visibility_timeout: Seconds a claimed shard stays hidden from other workers.
+
+    Returns:
+        Number of shards processed by this worker.
+    """
+    processed = 0
+    while max_shards is None or processed < max_shards:
+        message = queue.receive(visibility_timeout=visibility_timeout)
+        if message is None:
+            break
+        if not store.has_result(message.shard.run_id, message.shard.shard_id):
+            process_shard(validator, message.shard, store)
+            processed += 1
+        queue.ack(message.receipt)
+    return processed
+
+
+def merge_results(partials: Iterable[ValidationResult]) -> ValidationResult:
+    """Merge partial results into one result.
+
+    Locations are deduplicated by resource type and ID, so resources that
+    appear in more than one partial are only reported once. Errors for a
+    resource that was validated successfully elsewhere are dropped.
+
+    Args:
+        partials: Partial results to merge.
+
+    Returns:
+        The merged validation result.
+    """
+    merged = ValidationResult()
+    locations = {}
+    errors = {}
+    for partial in partials:
+        for location in partial.storage_locations:
+            locations.setdefault((location.type, location.id), location)
+        for error in partial.errors:
+            errors.setdefault((error['resource_id'], error['error_message']), error)
+        merged.not_validated += partial.not_validated
+
+    validated_ids = {resource_id for _, resource_id in locations}
+    merged.storage_locations = list(locations.values())
+    merged.errors = [
+        error for error in errors.values() if error['resource_id'] not in validated_ids
+    ]
+    merged._recalculate_encryption_status()
+    return merged
+
+
+def reduce_results(store: ResultStore, run_id: Optional[str] = None) -> ValidationResult:
+    """Merge a run's partial results into one result.
+
+    Shards listed in the manifest without a stored result are reported as
+    errors, so an incomplete scan is never reported as compliant.
+
+    Args:
+        store: Result store holding partial results.
+        run_id: Run to reduce. Defaults to the most recently coordinated run.
+
+    Returns:
+        The merged validation result.
+
+    Raises:
+        ValueError: If the store has no runs.
+    """
+    run_id = run_id or store.latest_run()
+    if run_id is None:
+        raise ValueError("No scan runs found in the result store")
+
+    manifest = store.get_manifest(run_id)
+    partials = {}
+    for shard_id, partial in store.iter_results(run_id):
+        if manifest is None or shard_id in manifest:
+            partials[shard_id] = partial
+
+    ordered_ids = manifest if manifest is not None else sorted(partials)
+    result = merge_results(partials[shard_id] for shard_id in ordered_ids if shard_id in partials)
+    for shard_id in ordered_ids:
+        if shard_id not in partials:
+            result.add_error(f"shard:{shard_id}", "Shard has no results")
+    return result
+
+
+def open_queue(uri: str, client_factory: Callable[[str], Any]) -> ShardQueue:
+    """Open a shard queue from a URI.
+
+    Args:
+        uri: SQS queue URL, or a path to a local SQLite queue file.
+        client_factory: Callable returning a boto3 client for a service name.
+
+    Returns:
+        The shard queue.
+    """
+    if uri.startswith('https://sqs.') or uri.startswith('https://queue.amazonaws.com'):
+        return SQSShardQueue(client_factory('sqs'), uri)
+    return SQLiteShardQueue(uri)
+
+
+def open_result_store(uri: str, client_factory: Callable[[str], Any]) -> ResultStore:
+    """Open a result store from a URI.
+
+    Args:
+        uri: `s3://bucket/prefix` URI, or a local directory path.
+        client_factory: Callable returning a boto3 client for a service name.
+
+    Returns:
+        The result store.
+    """
+    if uri.startswith('s3://'):
+        bucket, _, prefix = uri[len('s3://'):].partition('/')
+        return S3ResultStore(client_factory('s3'), bucket, prefix)
+    return LocalResultStore(uri)
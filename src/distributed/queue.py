@@ -0,0 +1,173 @@
+import hashlib
+import json
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Shard(BaseModel):
+    """A unit of scanning work handed to a single worker."""
+    shard_id: str
+    run_id: str
+    object_storage_ids: List[str] = Field(default_factory=list)
+    database_ids: List[str] = Field(default_factory=list)
+    database_types: Dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def create(cls, run_id: str, object_storage_ids: List[str], database_ids: List[str],
+               database_types: Dict[str, str]) -> "Shard":
+        """Create a shard whose ID is derived from its run and contents.
+
+        Content-derived IDs make re-submitting the same work within a run a
+        no-op and let workers and the reducer recognise duplicate deliveries.
+        Including the run ID means a later scan of the same resources gets
+        new shards and is validated again.
+        """
+        types = {db_id: database_types.get(db_id, 'dynamodb') for db_id in database_ids}
+        canonical = json.dumps([run_id, object_storage_ids, database_ids, types], sort_keys=True)
+        shard_id = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+        return cls(
+            shard_id=shard_id,
+            run_id=run_id,
+            object_storage_ids=object_storage_ids,
+            database_ids=database_ids,
+            database_types=types
+        )
+
+
+class ShardMessage(NamedTuple):
+    """A shard received from a queue, with the handle needed to ack it."""
+    shard: Shard
+    receipt: str
+
+
+class ShardQueue(ABC):
+    """Base class for shard work queues.
+
+    Queues have at-least-once semantics: a received shard that is not acked
+    before its visibility timeout expires is delivered again.
+    """
+
+    @abstractmethod
+    def put(self, shard: Shard) -> None:
+        """Add a shard to the queue."""
+        pass
+
+    @abstractmethod
+    def receive(self, visibility_timeout: int = 900) -> Optional[ShardMessage]:
+        """Claim the next available shard, or None if the queue is drained."""
+        pass
+
+    @abstractmethod
+    def ack(self, receipt: str) -> None:
+        """Remove a completed shard from the queue."""
+        pass
+
+
+class SQLiteShardQueue(ShardQueue):
+    """Shard queue backed by a local SQLite file.
+
+    Suitable for worker processes or containers sharing a filesystem.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the queue.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS shards ("
+            " shard_id TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " visible_at REAL NOT NULL DEFAULT 0,"
+            " receipt TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    def put(self, shard: Shard) -> None:
+        """Add a shard to the queue, ignoring shards already queued."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO shards (shard_id, body) VALUES (?, ?)",
+            (shard.shard_id, shard.model_dump_json())
+        )
+
+    def receive(self, visibility_timeout: int = 900) -> Optional[ShardMessage]:
+        """Claim the next visible shard."""
+        now = time.time()
+        receipt = uuid.uuid4().hex
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT shard_id, body FROM shards WHERE visible_at <= ? ORDER BY rowid LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                self._conn.execute("COMMIT")
+                return None
+            self._conn.execute(
+                "UPDATE shards SET visible_at = ?, receipt = ?, attempts = attempts + 1 WHERE shard_id = ?",
+                (now + visibility_timeout, receipt, row[0])
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return ShardMessage(shard=Shard.model_validate_json(row[1]), receipt=receipt)
+
+    def ack(self, receipt: str) -> None:
+        """Remove a completed shard from the queue."""
+        self._conn.execute("DELETE FROM shards WHERE receipt = ?", (receipt,))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM shards").fetchone()[0]
+
+
+class SQSShardQueue(ShardQueue):
+    """Shard queue backed by an Amazon SQS queue."""
+
+    def __init__(self, sqs_client: Any, queue_url: str, wait_time_seconds: int = 5):
+        """Initialize the queue.
+
+        Args:
+            sqs_client: boto3 SQS client.
+            queue_url: URL of the SQS queue.
+            wait_time_seconds: Long-poll duration when receiving.
+        """
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.wait_time_seconds = wait_time_seconds
+        self.fifo = queue_url.endswith('.fifo')
+
+    def put(self, shard: Shard) -> None:
+        """Send a shard to the queue."""
+        params = {'QueueUrl': self.queue_url, 'MessageBody': shard.model_dump_json()}
+        if self.fifo:
+            params['MessageGroupId'] = shard.shard_id
+            params['MessageDeduplicationId'] = shard.shard_id
+        self.sqs_client.send_message(**params)
+
+    def receive(self, visibility_timeout: int = 900) -> Optional[ShardMessage]:
+        """Receive the next shard, long-polling briefly."""
+        response = self.sqs_client.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=1,
+            WaitTimeSeconds=self.wait_time_seconds,
+            VisibilityTimeout=visibility_timeout
+        )
+        messages = response.get('Messages', [])
+        if not messages:
+            return None
+        message = messages[0]
+        return ShardMessage(shard=Shard.model_validate_json(message['Body']), receipt=message['ReceiptHandle'])
+
+    def ack(self, receipt: str) -> None:
+        """Delete a completed shard message."""
+        self.sqs_client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=receipt)
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+from ..models import ValidationResult
+
+
+MANIFEST_NAME = "manifest.json"
+LATEST_RUN_NAME = "latest-run.json"
+
+
+class ResultStore(ABC):
+    """Base class for stores holding partial per-shard results.
+
+    Results are grouped by scan run, each under its own `runs/<run_id>/`
+    prefix, so a repeat scan never sees the previous run's results. Writes
+    are keyed by run and shard ID and overwrite any previous write, so a
+    shard that is retried or delivered twice leaves a single partial result.
+    """
+
+    @abstractmethod
+    def put_result(self, run_id: str, shard_id: str, result: ValidationResult) -> None:
+        """Store the partial result for a shard."""
+        pass
+
+    @abstractmethod
+    def has_result(self, run_id: str, shard_id: str) -> bool:
+        """Check whether a shard already has a stored result."""
+        pass
+
+    @abstractmethod
+    def iter_results(self, run_id: str) -> Iterator[Tuple[str, ValidationResult]]:
+        """Iterate over a run's stored (shard ID, partial result) pairs."""
+        pass
+
+    @abstractmethod
+    def put_manifest(self, run_id: str, shard_ids: List[str]) -> None:
+        """Record the shard IDs that make up a run and mark it as the latest run."""
+        pass
+
+    @abstractmethod
+    def get_manifest(self, run_id: str) -> Optional[List[str]]:
+        """Get a run's recorded shard IDs, or None if no manifest exists."""
+        pass
+
+    @abstractmethod
+    def latest_run(self) -> Optional[str]:
+        """Get the ID of the most recently coordinated run, or None if there is none."""
+        pass
+
+
+def _manifest_body(run_id: str, shard_ids: List[str]) -> str:
+    return json.dumps({'run_id': run_id, 'shard_ids': shard_ids})
+
+
+class LocalResultStore(ResultStore):
+    """Result store writing one JSON file per shard to a local directory."""
+
+    def __init__(self, directory: str):
+        """Initialize the store.
+
+        Args:
+            directory: Directory to write partial results to.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(exist_ok=True, parents=True)
+
+    def _run_dir(self, run_id: str) -> Path:
+        return self.directory / "runs" / run_id
+
+    def _write(self, path: Path, content: str) -> None:
+        """Atomically write a file so readers never see partial content."""
+        path.parent.mkdir(exist_ok=True, parents=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def put_result(self, run_id: str, shard_id: str, result: ValidationResult) -> None:
+        self._write(self._run_dir(run_id) / f"shard-{shard_id}.json", result.model_dump_json())
+
+    def has_result(self, run_id: str, shard_id: str) -> bool:
+        return (self._run_dir(run_id) / f"shard-{shard_id}.json").exists()
+
+    def iter_results(self, run_id: str) -> Iterator[Tuple[str, ValidationResult]]:
+        for path in sorted(self._run_dir(run_id).glob("shard-*.json")):
+            shard_id = path.stem[len("shard-"):]
+            yield shard_id, ValidationResult.model_validate_json(path.read_text())
+
+    def put_manifest(self, run_id: str, shard_ids: List[str]) -> None:
+        body = _manifest_body(run_id, shard_ids)
+        self._write(self._run_dir(run_id) / MANIFEST_NAME, body)
+        self._write(self.directory / LATEST_RUN_NAME, body)
+
+    def get_manifest(self, run_id: str) -> Optional[List[str]]:
+        path = self._run_dir(run_id) / MANIFEST_NAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())['shard_ids']
+
+    def latest_run(self) -> Optional[str]:
+        path = self.directory / LATEST_RUN_NAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())['run_id']
+
+
+class S3ResultStore(ResultStore):
+    """Result store writing one JSON object per shard under an S3 prefix."""
+
+    def __init__(self, s3_client: Any, bucket: str, prefix: str = ""):
+        """Initialize the store.
+
+        Args:
+            s3_client: boto3 S3 client.
+            bucket: Bucket to write partial results to.
+            prefix: Key prefix for partial results.
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix.rstrip('/') + '/' if prefix else ''
+
+    def _run_prefix(self, run_id: str) -> str:
+        return f"{self.prefix}runs/{run_id}/"
+
+    def _get(self, key: str) -> Optional[bytes]:
+        """Read an object, or None if it does not exist."""
+        try:
+            return self.s3_client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+
+    def put_result(self, run_id: str, shard_id: str, result: ValidationResult) -> None:
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=f"{self._run_prefix(run_id)}shard-{shard_id}.json",
+            Body=result.model_dump_json().encode('utf-8')
+        )
+
+    def has_result(self, run_id: str, shard_id: str) -> bool:
+        response = self.s3_client.list_objects_v2(
+            Bucket=self.bucket,
+            Prefix=f"{self._run_prefix(run_id)}shard-{shard_id}.json",
+            MaxKeys=1
+        )
+        return response.get('KeyCount', 0) > 0
+
+    def iter_results(self, run_id: str) -> Iterator[Tuple[str, ValidationResult]]:
+        shard_prefix = f"{self._run_prefix(run_id)}shard-"
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=shard_prefix):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                shard_id = key[len(shard_prefix):-len(".json")]
+                body = self.s3_client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+                yield shard_id, ValidationResult.model_validate_json(body)
+
+    def put_manifest(self, run_id: str, shard_ids: List[str]) -> None:
+        body = _manifest_body(run_id, shard_ids).encode('utf-8')
+        # The latest-run pointer is written last, so it never names a run without a manifest
+        for key in (f"{self._run_prefix(run_id)}{MANIFEST_NAME}", f"{self.prefix}{LATEST_RUN_NAME}"):
+            self.s3_client.put_object(Bucket=self.bucket, Key=key, Body=body)
+
+    def get_manifest(self, run_id: str) -> Optional[List[str]]:
+        body = self._get(f"{self._run_prefix(run_id)}{MANIFEST_NAME}")
+        return None if body is None else json.loads(body)['shard_ids']
+
+    def latest_run(self) -> Optional[str]:
+        body = self._get(f"{self.prefix}{LATEST_RUN_NAME}")
+        return None if body is None else json.loads(body)['run_id']
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from .models import StorageLocation
+
+
+logger = logging.getLogger(__name__)
+
+SCAN_STARTED = "scan_started"
+RESOURCE_STARTED = "resource_started"
+RESOURCE_COMPLETED = "resource_completed"
+RESOURCE_RESTORED = "resource_restored"
+RESOURCE_FAILED = "resource_failed"
+SCAN_FINISHED = "scan_finished"
+
+
+class ValidationEvent(NamedTuple):
+    """An event emitted while validating resources."""
+    kind: str
+    timestamp: float
+    resource_id: Optional[str] = None
+    service: Optional[str] = None
+    location: Optional[StorageLocation] = None
+    error: Optional[str] = None
+    total: Optional[int] = None
+
+
+Subscriber = Callable[[ValidationEvent], None]
+
+
+class EventBus:
+    """Publishes validation events to subscribed callbacks.
+
+    Callbacks run synchronously on the thread that emits the event, so they
+    should be quick; a slow consumer should hand events off to a queue. A
+    callback that raises is logged and skipped, so a faulty integration
+    cannot abort the scan. The
+    subscriber list is replaced rather than mutated, so emitting never takes
+    a lock and is safe from any thread. Producers check `active` before
+    building an event, which keeps the cost with no subscribers to a single
+    attribute read.
+    """
+
+    def __init__(self):
+        self._subscribers: Tuple[Subscriber, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Whether any callbacks are subscribed."""
+        return bool(self._subscribers)
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Subscribe a callback to all events.
+
+        Args:
+            callback: Called with each `ValidationEvent`.
+
+        Returns:
+            A function that unsubscribes the callback.
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + (callback,)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """Remove a previously subscribed callback."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            if callback in subscribers:
+                subscribers.remove(callback)
+            self._subscribers = tuple(subscribers)
+
+    def subscribe_queue(self, queue: "asyncio.Queue", loop: Optional[asyncio.AbstractEventLoop] = None) -> Callable[[], None]:
+        """Forward events to an asyncio queue.
+
+        Events emitted from worker threads are handed to the loop with
+        `call_soon_threadsafe`, so async consumers can `await queue.get()`.
+
+        Args:
+            queue: Queue to put events on.
+            loop: Loop owning the queue. Defaults to the running loop.
+
+        Returns:
+            A function that unsubscribes the forwarder.
+        """
+        loop = loop or asyncio.get_running_loop()
+
+        def forward(event: ValidationEvent) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        return self.subscribe(forward)
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        """Emit an event to all subscribers."""
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        event = ValidationEvent(kind=kind, timestamp=time.monotonic(), **fields)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Event subscriber %r failed on %s", callback, kind)
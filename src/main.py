@@ -1,11 +1,22 @@
 import os
 import click
-from typing import List, Optional
+from contextlib import contextmanager, nullcontext
+from typing import Iterator, List, Optional
 from dotenv import load_dotenv
 from rich.console import Console
 
+from .providers.aws import AWSProvider
 from .validators.aws_validator import AWSValidator
 from .report.generator import ReportGenerator
+from .checkpoint import DEFAULT_FLUSH_EVERY, open_checkpoint
+from .policy.engine import PolicyError, load_policy
+from .reevaluate import load_result, reevaluate as reevaluate_result
+from .progress import LiveProgress
+from .profiling import Tracer, profiling_enabled
+from .distributed.coordinator import (
+    DEFAULT_SHARD_SIZE, coordinate as coordinate_shards, new_run_id, open_queue, open_result_store,
+    reduce_results, run_worker
+)
 
 
 # Initialize console for pretty output
@@ -22,42 +33,17 @@ def cli():
     load_dotenv()
 
 
-@cli.command()
-@click.option('--provider', type=click.Choice(['aws', 'azure', 'gcp']), default='aws',
-              help='Cloud provider to validate.')
-@click.option('--region', help='Cloud provider region.')
-@click.option('--profile', help='Cloud provider profile (e.g. AWS profile).')
-@click.option('--s3-buckets', help='Comma-separated list of S3 bucket names to validate.')
-@click.option('--dynamodb-tables', help='Comma-separated list of DynamoDB table names to validate.')
-@click.option('--rds-instances', help='Comma-separated list of RDS instance identifiers to validate.')
-@click.option('--output-dir', help='Directory to write reports to.')
-@click.option('--format', 'output_format', type=click.Choice(['json', 'csv', 'all']), default='all',
-              help='Output format for the report.')
-def validate(provider: str, region: Optional[str], profile: Optional[str],
-             s3_buckets: Optional[str], dynamodb_tables: Optional[str], 
-             rds_instances: Optional[str], output_dir: Optional[str],
-             output_format: str):
-    """Validate encryption for cloud resources."""
-    # Parse comma-separated lists
+def _parse_resources(s3_buckets: Optional[str], dynamodb_tables: Optional[str],
+                     rds_instances: Optional[str]):
+    """Parse comma-separated resource options.
+    
+    Returns:
+        Tuple of (object storage IDs, database IDs, database types by ID).
+    """
     s3_bucket_list = s3_buckets.split(',') if s3_buckets else []
     dynamodb_table_list = dynamodb_tables.split(',') if dynamodb_tables else []
     rds_instance_list = rds_instances.split(',') if rds_instances else []
     
-    # Validate at least one resource type was specified
-    if not any([s3_bucket_list, dynamodb_table_list, rds_instance_list]):
-        console.print("[bold red]Error:[/bold red] No resources specified for validation.")
-        console.print("Please specify at least one resource using --s3-buckets, --dynamodb-tables, or --rds-instances.")
-        return
-    
-    # Initialize validator based on provider
-    if provider == 'aws':
-        validator = AWSValidator(region_name=region, profile=profile)
-    else:
-        console.print(f"[bold red]Error:[/bold red] Provider {provider} not yet implemented.")
-        return
-    
-    console.print(f"[bold green]Starting validation for {provider.upper()} resources...[/bold green]")
-    
     # Track databases to validate with their type
     database_ids = []
     database_types = {}
@@ -70,14 +56,11 @@ def validate(provider: str, region: Optional[str], profile: Optional[str],
         database_ids.append(instance)
         database_types[instance] = 'rds'
     
-    # Run validation
-    result = validator.validate_all(
-        object_storage_ids=s3_bucket_list,
-        database_ids=database_ids,
-        db_type=lambda db_id: database_types.get(db_id, 'dynamodb')
-    )
-    
-    # Generate reports
+    return s3_bucket_list, database_ids, database_types
+
+
+def _write_reports(result, output_dir: Optional[str], output_format: str) -> None:
+    """Write reports for a result and print a summary to the console."""
     report_generator = ReportGenerator(output_dir=output_dir)
     
     if output_format == 'json' or output_format == 'all':
@@ -106,5 +89,249 @@ def validate(provider: str, region: Optional[str], profile: Optional[str],
         console.print(f"\n[bold yellow]Errors: {len(result.errors)}[/bold yellow]")
 
 
+@contextmanager
+def _profile_run(trace_path: Optional[str], sample_rate: float) -> Iterator[None]:
+    """Trace the enclosed block when `trace_path` is set.
+    
+    The Chrome trace is written and a hot-spot summary printed when the
+    block exits, including on early return.
+    """
+    if not trace_path:
+        yield
+        return
+    tracer = Tracer(sample_rate=sample_rate)
+    try:
+        with profiling_enabled(tracer):
+            yield
+    finally:
+        tracer.write_chrome_trace(trace_path)
+        console.print(f"\nProfile trace written to: [bold]{trace_path}[/bold]")
+        console.print(tracer.format_hot_spots(), markup=False, highlight=False)
+
+
+@cli.command()
+@click.option('--provider', type=click.Choice(['aws', 'azure', 'gcp']), default='aws',
+              help='Cloud provider to validate.')
+@click.option('--region', help='Cloud provider region.')
+@click.option('--profile', help='Cloud provider profile (e.g. AWS profile).')
+@click.option('--s3-buckets', help='Comma-separated list of S3 bucket names to validate.')
+@click.option('--dynamodb-tables', help='Comma-separated list of DynamoDB table names to validate.')
+@click.option('--rds-instances', help='Comma-separated list of RDS instance identifiers to validate.')
+@click.option('--output-dir', help='Directory to write reports to.')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'csv', 'all']), default='all',
+              help='Output format for the report.')
+@click.option('--checkpoint', 'checkpoint_uri',
+              help='Local file or s3://bucket/prefix to journal completed resources to.')
+@click.option('--resume', is_flag=True,
+              help='Skip resources already completed in the checkpoint journal.')
+@click.option('--checkpoint-every', type=int, default=DEFAULT_FLUSH_EVERY, show_default=True,
+              help='Number of completed resources per checkpoint write.')
+@click.option('--policy', 'policy_name', default='default', show_default=True,
+              help='Built-in policy name (default, fedramp-moderate, fedramp-high) or path to a YAML policy.')
+@click.option('--use-fips-endpoint/--no-use-fips-endpoint', default=None,
+              help='Use FIPS 140 validated AWS endpoints. Defaults to AWS_USE_FIPS_ENDPOINT / the AWS config.')
+@click.option('--progress/--no-progress', default=None,
+              help='Show live progress. Defaults to on when writing to a terminal.')
+@click.option('--profile-run', 'profile_trace',
+              help='Record a Chrome trace / Perfetto JSON of the run to this path.')
+@click.option('--profile-sample-rate', type=click.FloatRange(0.0, 1.0), default=1.0, show_default=True,
+              help='Fraction of resources traced when profiling.')
+def validate(provider: str, region: Optional[str], profile: Optional[str],
+             s3_buckets: Optional[str], dynamodb_tables: Optional[str], 
+             rds_instances: Optional[str], output_dir: Optional[str],
+             output_format: str, checkpoint_uri: Optional[str], resume: bool,
+             checkpoint_every: int, policy_name: str, progress: Optional[bool],
+             use_fips_endpoint: Optional[bool], profile_trace: Optional[str], profile_sample_rate: float):
+    """Validate encryption for cloud resources."""
+    # Parse comma-separated lists
+    s3_bucket_list, database_ids, database_types = _parse_resources(
+        s3_buckets, dynamodb_tables, rds_instances
+    )
+    
+    # Validate at least one resource type was specified
+    if not any([s3_bucket_list, database_ids]):
+        console.print("[bold red]Error:[/bold red] No resources specified for validation.")
+        console.print("Please specify at least one resource using --s3-buckets, --dynamodb-tables, or --rds-instances.")
+        return
+    
+    try:
+        policy = load_policy(policy_name)
+    except (OSError, PolicyError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+    
+    # Profile from before the validator exists so client setup is traced
+    with _profile_run(profile_trace, profile_sample_rate):
+        # Initialize validator based on provider
+        if provider == 'aws':
+            validator = AWSValidator(region_name=region, profile=profile, policy=policy,
+                                     use_fips_endpoint=use_fips_endpoint)
+        else:
+            console.print(f"[bold red]Error:[/bold red] Provider {provider} not yet implemented.")
+            return
+        
+        if resume and not checkpoint_uri:
+            console.print("[bold red]Error:[/bold red] --resume requires --checkpoint.")
+            return
+        
+        checkpoint = None
+        if checkpoint_uri:
+            checkpoint = open_checkpoint(checkpoint_uri, validator.aws.get_client,
+                                         resume=resume, flush_every=checkpoint_every)
+            if resume:
+                console.print(f"Resuming with {len(checkpoint.completed())} resources already completed.")
+        
+        console.print(f"[bold green]Starting validation for {provider.upper()} resources...[/bold green]")
+        
+        # Run validation
+        if progress is None:
+            progress = console.is_terminal
+        with LiveProgress(validator.events, console) if progress else nullcontext():
+            result = validator.validate_all(
+                object_storage_ids=s3_bucket_list,
+                database_ids=database_ids,
+                checkpoint=checkpoint,
+                db_type=lambda db_id: database_types.get(db_id, 'dynamodb')
+            )
+        
+        _write_reports(result, output_dir, output_format)
+
+
+@cli.command()
+@click.option('--queue', 'queue_uri', required=True,
+              help='SQS queue URL or path to a local SQLite queue file.')
+@click.option('--results', 'results_uri', required=True,
+              help='s3://bucket/prefix or local directory for partial results.')
+@click.option('--region', help='Cloud provider region.')
+@click.option('--profile', help='Cloud provider profile (e.g. AWS profile).')
+@click.option('--s3-buckets', help='Comma-separated list of S3 bucket names to validate.')
+@click.option('--dynamodb-tables', help='Comma-separated list of DynamoDB table names to validate.')
+@click.option('--rds-instances', help='Comma-separated list of RDS instance identifiers to validate.')
+@click.option('--discover', is_flag=True,
+              help='Enumerate all S3 buckets, DynamoDB tables and RDS instances in the account.')
+@click.option('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, show_default=True,
+              help='Maximum number of resources per shard.')
+def coordinate(queue_uri: str, results_uri: str, region: Optional[str], profile: Optional[str],
+               s3_buckets: Optional[str], dynamodb_tables: Optional[str],
+               rds_instances: Optional[str], discover: bool, shard_size: int):
+    """Split resources into shards and enqueue them for workers."""
+    s3_bucket_list, database_ids, database_types = _parse_resources(
+        s3_buckets, dynamodb_tables, rds_instances
+    )
+    
+    validator = AWSValidator(region_name=region, profile=profile)
+    
+    if discover:
+        s3_bucket_list += validator.aws.list_s3_buckets()
+        for table in validator.aws.list_dynamodb_tables():
+            database_ids.append(table)
+            database_types[table] = 'dynamodb'
+        for instance in validator.aws.list_rds_instances():
+            database_ids.append(instance)
+            database_types[instance] = 'rds'
+    
+    if not any([s3_bucket_list, database_ids]):
+        console.print("[bold red]Error:[/bold red] No resources specified for validation.")
+        console.print("Please specify resources using --s3-buckets, --dynamodb-tables, --rds-instances or --discover.")
+        return
+    
+    queue = open_queue(queue_uri, validator.aws.get_client)
+    store = open_result_store(results_uri, validator.aws.get_client)
+    run_id = new_run_id()
+    shards = coordinate_shards(queue, store, s3_bucket_list, database_ids, database_types, shard_size,
+                               run_id=run_id)
+    
+    console.print(f"Enqueued [bold]{len(shards)}[/bold] shards covering "
+                  f"{len(s3_bucket_list) + len(database_ids)} resources for run [bold]{run_id}[/bold].")
+
+
+@cli.command()
+@click.option('--queue', 'queue_uri', required=True,
+              help='SQS queue URL or path to a local SQLite queue file.')
+@click.option('--results', 'results_uri', required=True,
+              help='s3://bucket/prefix or local directory for partial results.')
+@click.option('--region', help='Cloud provider region.')
+@click.option('--profile', help='Cloud provider profile (e.g. AWS profile).')
+@click.option('--max-shards', type=int, help='Stop after processing this many shards.')
+@click.option('--visibility-timeout', type=int, default=900, show_default=True,
+              help='Seconds a claimed shard is hidden from other workers.')
+@click.option('--policy', 'policy_name', default='default', show_default=True,
+              help='Built-in policy name (default, fedramp-moderate, fedramp-high) or path to a YAML policy.')
+@click.option('--use-fips-endpoint/--no-use-fips-endpoint', default=None,
+              help='Use FIPS 140 validated AWS endpoints. Defaults to AWS_USE_FIPS_ENDPOINT / the AWS config.')
+def work(queue_uri: str, results_uri: str, region: Optional[str], profile: Optional[str],
+         max_shards: Optional[int], visibility_timeout: int, policy_name: str,
+         use_fips_endpoint: Optional[bool]):
+    """Process shards from the queue until it is drained."""
+    validator = AWSValidator(region_name=region, profile=profile, policy=load_policy(policy_name),
+                             use_fips_endpoint=use_fips_endpoint)
+    queue = open_queue(queue_uri, validator.aws.get_client)
+    store = open_result_store(results_uri, validator.aws.get_client)
+    
+    processed = run_worker(validator, queue, store, max_shards=max_shards,
+                           visibility_timeout=visibility_timeout)
+    console.print(f"Processed [bold]{processed}[/bold] shards.")
+
+
+@cli.command()
+@click.option('--results', 'results_uri', required=True,
+              help='s3://bucket/prefix or local directory holding partial results.')
+@click.option('--region', help='Cloud provider region.')
+@click.option('--profile', help='Cloud provider profile (e.g. AWS profile).')
+@click.option('--run-id', help='Scan run to merge. Defaults to the most recently coordinated run.')
+@click.option('--output-dir', help='Directory to write reports to.')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'csv', 'all']), default='all',
+              help='Output format for the report.')
+def reduce(results_uri: str, region: Optional[str], profile: Optional[str], run_id: Optional[str],
+           output_dir: Optional[str], output_format: str):
+    """Merge partial shard results into a single report."""
+    provider = AWSProvider(region_name=region, profile=profile)
+    store = open_result_store(results_uri, provider.get_client)
+    try:
+        result = reduce_results(store, run_id)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+    _write_reports(result, output_dir, output_format)
+
+
+
+@cli.command()
+@click.argument('source')
+@click.option('--policy', 'policy_name', default='default', show_default=True,
+              help='Built-in policy name (default, fedramp-moderate, fedramp-high) or path to a YAML policy.')
+@click.option('--workers', type=int,
+              help='Worker processes for very large inputs. Defaults to the number of CPUs.')
+@click.option('--region', help='Cloud provider region (for s3:// sources).')
+@click.option('--profile', help='Cloud provider profile (for s3:// sources).')
+@click.option('--output-dir', help='Directory to write reports to.')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'csv', 'all']), default='all',
+              help='Output format for the report.')
+def reevaluate(source: str, policy_name: str, workers: Optional[int], region: Optional[str],
+               profile: Optional[str], output_dir: Optional[str], output_format: str):
+    """Re-evaluate compliance of a previous run without scanning.
+    
+    SOURCE is a JSON report, an NDJSON file of locations or checkpoint
+    records, or a directory or s3:// prefix of distributed partial results.
+    """
+    try:
+        policy = load_policy(policy_name)
+    except (OSError, PolicyError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+    
+    provider = AWSProvider(region_name=region, profile=profile)
+    try:
+        result = load_result(source, provider.get_client)
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Error:[/bold red] Could not load results from {source}: {e}")
+        return
+    console.print(f"Re-evaluating {len(result.storage_locations)} locations against policy "
+                  f"[bold]{policy.name}[/bold]...")
+    
+    reevaluate_result(result, policy, processes=workers)
+    _write_reports(result, output_dir, output_format)
+
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
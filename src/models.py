@@ -35,11 +35,18 @@ class ValidationResult(BaseModel):
     all_encrypted: bool = False
     storage_locations: List[StorageLocation] = Field(default_factory=list)
     errors: List[Dict] = Field(default_factory=list)
+    # Resources left unvalidated because the scan stopped early
+    not_validated: int = 0
     
     def add_location(self, location: StorageLocation) -> None:
         """Add a storage location to the results."""
         self.storage_locations.append(location)
-        self._recalculate_encryption_status()
+        # Update incrementally rather than rescanning every location, which
+        # would make building a large result quadratic
+        if len(self.storage_locations) == 1:
+            self.all_encrypted = location.compliant and not self.errors
+        else:
+            self.all_encrypted = self.all_encrypted and location.compliant
     
     def add_error(self, resource_id: str, error_message: str) -> None:
         """Add an error to the results."""
@@ -47,7 +54,7 @@ class ValidationResult(BaseModel):
             "resource_id": resource_id,
             "error_message": error_message
         })
-        self._recalculate_encryption_status()
+        self.all_encrypted = False
     
     def _recalculate_encryption_status(self) -> None:
         """Recalculate the overall encryption status."""
@@ -0,0 +1,361 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import yaml
+
+from ..models import EncryptionType, StorageLocation, ValidationResult
+
+
+BUILTIN_POLICY_DIR = Path(__file__).parent / "policies"
+
+# Location attributes rules can select on, as opposed to encryption details
+LOCATION_FIELDS = ('resource_type', 'provider', 'region')
+
+# Upper bound on memoized outcomes, for policies over high-cardinality fields
+MAX_CACHE_SIZE = 100_000
+
+Predicate = Callable[[Tuple], bool]
+
+_EMPTY: Mapping[str, Any] = {}
+
+
+class PolicyError(ValueError):
+    """Raised when a policy file is invalid."""
+
+
+def classify_encryption(encryption_info: Optional[Mapping[str, Any]]) -> EncryptionType:
+    """Map raw encryption details to an encryption type.
+
+    Args:
+        encryption_info: Encryption details returned by a provider.
+
+    Returns:
+        EncryptionType: The encryption type the details describe.
+    """
+    if not encryption_info or encryption_info.get('status') != 'encrypted':
+        return EncryptionType.NONE
+    encryption_type_str = encryption_info.get('type')
+    if encryption_type_str == 'server_side':
+        return EncryptionType.SERVER_SIDE
+    if encryption_type_str == 'customer_managed_key':
+        return EncryptionType.CUSTOMER_MANAGED_KEY
+    return EncryptionType.NONE
+
+
+def _compile_condition(field: str, index: int, spec: Any) -> Predicate:
+    """Compile one field condition into a predicate over a value tuple."""
+    if isinstance(spec, list):
+        spec = {'in': spec}
+    elif not isinstance(spec, dict):
+        spec = {'equals': spec}
+
+    checks = []
+    for operator, expected in spec.items():
+        if operator == 'equals':
+            checks.append(lambda row, e=expected: row[index] == e)
+        elif operator == 'in':
+            allowed = frozenset(expected)
+            checks.append(lambda row, a=allowed: row[index] in a)
+        elif operator == 'not_in':
+            denied = frozenset(expected)
+            checks.append(lambda row, d=denied: row[index] not in d)
+        elif operator == 'exists':
+            checks.append(lambda row, e=bool(expected): (row[index] is not None) == e)
+        elif operator == 'prefix':
+            checks.append(lambda row, p=str(expected): isinstance(row[index], str) and row[index].startswith(p))
+        else:
+            raise PolicyError(f"Unknown operator '{operator}' for field '{field}'")
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda row: all(check(row) for check in checks)
+
+
+def _compile_conditions(conditions: Mapping[str, Any], fields: List[str]) -> Predicate:
+    """Compile a mapping of field conditions into a single predicate."""
+    predicates = [
+        _compile_condition(field, fields.index(field), spec)
+        for field, spec in conditions.items()
+    ]
+    if not predicates:
+        return lambda row: True
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda row: all(predicate(row) for predicate in predicates)
+
+
+class Rule:
+    """A single compiled policy rule."""
+
+    def __init__(self, rule_id: str, description: str, applies: Predicate, check: Predicate):
+        self.id = rule_id
+        self.description = description
+        self.applies = applies
+        self.check = check
+
+    def passes(self, row: Tuple) -> bool:
+        """Check whether a value tuple satisfies the rule."""
+        return not self.applies(row) or self.check(row)
+
+
+class Policy:
+    """Declarative compliance policy compiled into fast predicates.
+
+    A policy is a list of rules. Each rule has an optional `applies_to`
+    selector over location fields (`resource_type`, `provider`, `region`)
+    and a `require` mapping over encryption detail fields. A location is
+    compliant when every rule that applies to it passes.
+
+    Conditions are compiled once into closures over a tuple of just the
+    fields the policy references, and results are memoized per distinct
+    tuple, so evaluating many locations costs little more than one dict
+    lookup each.
+    """
+
+    def __init__(self, name: str, rules: List[Dict[str, Any]], description: str = "",
+                 source: Optional[str] = None):
+        """Compile a policy.
+
+        Args:
+            name: Policy name.
+            rules: Rule definitions as loaded from a policy file.
+            description: Optional human-readable description.
+            source: Built-in name or file path the policy can be reloaded from.
+        """
+        self.name = name
+        self.description = description
+        self.source = source
+
+        referenced: List[str] = []
+        value_fields = set()
+        for rule in rules:
+            if not isinstance(rule, dict):
+                continue
+            for section in ('applies_to', 'require'):
+                for field, spec in (rule.get(section) or {}).items():
+                    if field not in referenced:
+                        referenced.append(field)
+                    if not isinstance(spec, dict) or set(spec) != {'exists'}:
+                        value_fields.add(field)
+        # Location fields come first so detail values can be appended in bulk
+        self._location_fields = tuple(f for f in referenced if f in LOCATION_FIELDS)
+        self._detail_fields = tuple(f for f in referenced if f not in LOCATION_FIELDS)
+        self.fields = self._location_fields + self._detail_fields
+        # Fields only tested with `exists` are reduced to presence in rows, so
+        # high-cardinality values such as key ARNs share one memo entry
+        self._presence_indexes = tuple(
+            index for index, field in enumerate(self.fields) if field not in value_fields
+        )
+        fields = list(self.fields)
+
+        self.rules = []
+        for position, rule in enumerate(rules):
+            if not isinstance(rule, dict) or 'require' not in rule:
+                raise PolicyError(f"Rule {position} in policy '{name}' must define 'require'")
+            self.rules.append(Rule(
+                rule_id=rule.get('id', f"rule-{position}"),
+                description=rule.get('description', ''),
+                applies=_compile_conditions(rule.get('applies_to') or {}, fields),
+                check=_compile_conditions(rule['require'] or {}, fields)
+            ))
+
+        self._cache: Dict[Tuple, bool] = {}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], source: Optional[str] = None) -> "Policy":
+        """Create a policy from its parsed file contents."""
+        if not isinstance(data, Mapping) or not isinstance(data.get('rules'), list):
+            raise PolicyError("Policy must be a mapping with a 'rules' list")
+        return cls(
+            name=data.get('name', 'unnamed'),
+            rules=data['rules'],
+            description=data.get('description', ''),
+            source=source
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> "Policy":
+        """Load a policy from a YAML file."""
+        with open(path) as f:
+            return cls.from_dict(yaml.safe_load(f), source=path)
+
+    def _row(self, resource_type: str, provider: str, region: Optional[str],
+             encryption_info: Optional[Mapping[str, Any]]) -> Tuple:
+        """Extract the referenced field values for one location."""
+        row = tuple(map((encryption_info or _EMPTY).get, self._detail_fields))
+        if self._location_fields:
+            location_values = {'resource_type': resource_type, 'provider': provider, 'region': region}
+            row = tuple(location_values[field] for field in self._location_fields) + row
+        if self._presence_indexes:
+            values = list(row)
+            for index in self._presence_indexes:
+                if values[index] is not None:
+                    values[index] = True
+            row = tuple(values)
+        return row
+
+    def _evaluate_row(self, row: Tuple) -> bool:
+        """Evaluate a value tuple, memoizing the outcome."""
+        try:
+            return self._cache[row]
+        except KeyError:
+            compliant = all(rule.passes(row) for rule in self.rules)
+            if len(self._cache) >= MAX_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[row] = compliant
+            return compliant
+        except TypeError:
+            # Unhashable detail values cannot be memoized
+            return all(rule.passes(row) for rule in self.rules)
+
+    def evaluate(self, resource_type: str, provider: str, region: Optional[str],
+                 encryption_info: Optional[Mapping[str, Any]]) -> bool:
+        """Evaluate compliance for a single location.
+
+        Args:
+            resource_type: Resource type value (e.g. 'object_storage').
+            provider: Provider name (e.g. 'aws').
+            region: Region of the location.
+            encryption_info: Raw encryption details.
+
+        Returns:
+            Whether the location is compliant.
+        """
+        return self._evaluate_row(self._row(resource_type, provider, region, encryption_info))
+
+    def failed_rules(self, resource_type: str, provider: str, region: Optional[str],
+                     encryption_info: Optional[Mapping[str, Any]]) -> List[str]:
+        """Get the IDs of rules a location fails."""
+        row = self._row(resource_type, provider, region, encryption_info)
+        return [rule.id for rule in self.rules if not rule.passes(row)]
+
+    def rows(self, columns: Mapping[str, Sequence[Any]]) -> List[Tuple]:
+        """Convert columnar data to value tuples of the referenced fields.
+
+        Args:
+            columns: Mapping of field name to a column of values. Fields the
+                policy references but that are missing are treated as None.
+
+        Returns:
+            One value tuple per row.
+        """
+        length = len(next(iter(columns.values()))) if columns else 0
+        if not self.fields:
+            return [()] * length
+        missing = [None] * length
+        selected = [columns.get(field, missing) for field in self.fields]
+        for index in self._presence_indexes:
+            selected[index] = [None if value is None else True for value in selected[index]]
+        return list(zip(*selected))
+
+    def evaluate_rows(self, rows: Iterable[Tuple]) -> List[bool]:
+        """Evaluate compliance for value tuples produced by `rows`."""
+        return list(map(self._evaluate_row, rows))
+
+    def evaluate_columns(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        """Evaluate compliance over columnar data.
+
+        Args:
+            columns: Mapping of field name to a column of values. Fields the
+                policy references but that are missing are treated as None.
+
+        Returns:
+            Compliance for each row.
+        """
+        return self.evaluate_rows(self.rows(columns))
+
+    def location_columns(self, locations: Sequence[StorageLocation]) -> Dict[str, List[Any]]:
+        """Extract columns of the referenced fields from locations."""
+        columns: Dict[str, List[Any]] = {}
+        if 'resource_type' in self._location_fields:
+            columns['resource_type'] = [location.type.value for location in locations]
+        if 'provider' in self._location_fields:
+            columns['provider'] = [location.provider for location in locations]
+        if 'region' in self._location_fields:
+            columns['region'] = [location.region for location in locations]
+        if self._detail_fields:
+            details = [location.encryption_details or _EMPTY for location in locations]
+            for field in self._detail_fields:
+                columns[field] = [detail.get(field) for detail in details]
+        return columns
+
+    def evaluate_locations(self, locations: Sequence[StorageLocation]) -> List[bool]:
+        """Evaluate compliance for many locations without API calls.
+
+        Locations are converted to columns of just the referenced fields and
+        evaluated in bulk.
+        """
+        if not self.fields:
+            return [self._evaluate_row(())] * len(locations)
+        return self.evaluate_columns(self.location_columns(locations))
+
+    def apply(self, result: ValidationResult,
+              evaluate_rows: Optional[Callable[[List[Tuple]], List[bool]]] = None) -> ValidationResult:
+        """Re-evaluate every location in a result against this policy.
+
+        Encryption type and compliance are recomputed from the stored
+        encryption details, locations are updated in place and the overall
+        status recalculated, so a cached scan can be checked against a new
+        policy without any API calls.
+
+        Args:
+            result: A previous validation result.
+            evaluate_rows: Optional replacement for `evaluate_rows`, e.g. one
+                that spreads evaluation across processes.
+
+        Returns:
+            The same result, updated.
+        """
+        locations = result.storage_locations
+        rows = self.rows(self.location_columns(locations)) if self.fields else [()] * len(locations)
+        compliance = (evaluate_rows or self.evaluate_rows)(rows)
+
+        # Encryption type only depends on status and type, so classify each
+        # distinct pair once
+        encryption_types: Dict[Tuple, EncryptionType] = {}
+        for location, compliant in zip(locations, compliance):
+            details = location.encryption_details or _EMPTY
+            classification_key = (details.get('status'), details.get('type'))
+            encryption_type = encryption_types.get(classification_key)
+            if encryption_type is None:
+                encryption_type = encryption_types[classification_key] = classify_encryption(details)
+            if location.encryption_type != encryption_type:
+                location.encryption_type = encryption_type
+            if location.compliant != compliant:
+                location.compliant = compliant
+        result._recalculate_encryption_status()
+        return result
+
+
+_builtin_policies: Dict[str, Policy] = {}
+
+
+def list_builtin_policies() -> List[str]:
+    """List the names of the policies shipped with the tool."""
+    return sorted(path.stem for path in BUILTIN_POLICY_DIR.glob("*.yaml"))
+
+
+def load_policy(name_or_path: Optional[str] = None) -> Policy:
+    """Load a built-in policy by name, or a policy file by path.
+
+    Args:
+        name_or_path: Built-in policy name (e.g. 'fedramp-high') or path to a
+            YAML policy file. Defaults to the 'default' policy.
+
+    Returns:
+        The compiled policy.
+    """
+    name = name_or_path or 'default'
+    builtin_path = BUILTIN_POLICY_DIR / f"{name}.yaml"
+    if builtin_path.exists():
+        if name not in _builtin_policies:
+            policy = Policy.from_file(str(builtin_path))
+            policy.source = name
+            _builtin_policies[name] = policy
+        return _builtin_policies[name]
+    if not Path(name).exists():
+        raise PolicyError(
+            f"Policy '{name}' is not a file or built-in policy "
+            f"({', '.join(list_builtin_policies())})"
+        )
+    return Policy.from_file(name)
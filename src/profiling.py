@@ -0,0 +1,286 @@
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+DEFAULT_MAX_EVENTS = 500_000
+
+
+class _NullSpan:
+    """Span used when tracing is disabled or the current trace is not sampled."""
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """A recorded span, written to the tracer when it closes."""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start', 'resource')
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any],
+                 resource: bool = False):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.resource = resource
+
+    def __enter__(self) -> "_Span":
+        if self.resource:
+            self.tracer._local.in_resource = True
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        if self.resource:
+            self.tracer._local.in_resource = False
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._record(self, end)
+
+
+class _UnsampledResource:
+    """Span of a resource that was not sampled; suppresses its nested spans."""
+
+    __slots__ = ('tracer',)
+
+    def __init__(self, tracer: "Tracer"):
+        self.tracer = tracer
+
+    def __enter__(self) -> "_UnsampledResource":
+        self.tracer._local.suppressed = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tracer._local.suppressed = False
+
+
+class Tracer:
+    """Records timed spans for Chrome trace / Perfetto output.
+
+    Sampling applies only to per-resource work: it is decided when a
+    resource span opens and inherited by the spans nested in it, so sampled
+    resources always have complete traces. Other spans, such as client
+    setup and report writing, happen once per run and are always recorded.
+    The number of recorded events is capped, so memory stays bounded when
+    left enabled on long production runs.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_events: int = DEFAULT_MAX_EVENTS,
+                 seed: Optional[int] = None):
+        """Initialize the tracer.
+
+        Args:
+            sample_rate: Fraction of resources to record, between 0 and 1.
+            max_events: Maximum number of spans kept; later spans are counted
+                as dropped.
+            seed: Optional seed for sampling decisions.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.max_events = max_events
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name: str, category: str = "app", always: bool = False, **args: Any):
+        """Create a span context manager.
+
+        Args:
+            name: Span name, e.g. 'aws.s3.get_bucket_encryption'.
+            category: Span category, e.g. 'aws' or 'report'.
+            always: Record the span even inside a resource that was not
+                sampled, for one-off work such as client setup.
+            **args: Extra values shown with the span in the trace viewer.
+        """
+        if not always and getattr(self._local, 'suppressed', False):
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def resource_span(self, name: str, category: str = "app", **args: Any):
+        """Create a span for the work on one resource, the unit of sampling.
+
+        Args:
+            name: Span name, e.g. 'validate.object_storage'.
+            category: Span category.
+            **args: Extra values shown with the span in the trace viewer.
+        """
+        local = self._local
+        if getattr(local, 'suppressed', False):
+            return _NULL_SPAN
+        if getattr(local, 'in_resource', False):
+            return _Span(self, name, category, args)
+        if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            return _UnsampledResource(self)
+        return _Span(self, name, category, args, resource=True)
+
+    def _record(self, span: _Span, end: float) -> None:
+        event = {
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': round((span.start - self._origin) * 1e6, 3),
+            'dur': round((end - span.start) * 1e6, 3),
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+        }
+        if span.args:
+            event['args'] = span.args
+        with self._lock:
+            if len(self.events) < self.max_events:
+                self.events.append(event)
+            else:
+                self.dropped += 1
+
+    def hot_spots(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        """Aggregate recorded spans by name, slowest total time first.
+
+        Args:
+            top_n: Number of entries to return.
+
+        Returns:
+            List of dicts with name, category, count, and total/mean/max
+            duration in milliseconds.
+        """
+        totals: Dict[str, Dict[str, Any]] = defaultdict(lambda: {'count': 0, 'total': 0.0, 'max': 0.0})
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            stats = totals[event['name']]
+            stats['category'] = event['cat']
+            stats['count'] += 1
+            stats['total'] += event['dur']
+            stats['max'] = max(stats['max'], event['dur'])
+        ranked = sorted(totals.items(), key=lambda item: item[1]['total'], reverse=True)
+        return [
+            {
+                'name': name,
+                'category': stats['category'],
+                'count': stats['count'],
+                'total_ms': round(stats['total'] / 1000, 3),
+                'mean_ms': round(stats['total'] / stats['count'] / 1000, 3),
+                'max_ms': round(stats['max'] / 1000, 3),
+            }
+            for name, stats in ranked[:top_n]
+        ]
+
+    def format_hot_spots(self, top_n: int = 10) -> str:
+        """Format the hot-spot summary as a plain-text table."""
+        lines = [f"{'span':<45} {'count':>8} {'total ms':>12} {'mean ms':>10} {'max ms':>10}"]
+        for spot in self.hot_spots(top_n):
+            lines.append(
+                f"{spot['name']:<45} {spot['count']:>8} {spot['total_ms']:>12.3f} "
+                f"{spot['mean_ms']:>10.3f} {spot['max_ms']:>10.3f}"
+            )
+        if self.sample_rate < 1.0:
+            lines.append(f"(sampled at {self.sample_rate:.0%} of resources)")
+        if self.dropped:
+            lines.append(f"({self.dropped} spans dropped after reaching {self.max_events} events)")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Get the trace in Chrome trace event format, which Perfetto also reads."""
+        with self._lock:
+            events = list(self.events)
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'sample_rate': self.sample_rate,
+                'dropped_events': self.dropped,
+                'hot_spots': self.hot_spots(),
+            },
+        }
+
+    def write_chrome_trace(self, path: str) -> str:
+        """Write the trace to a JSON file.
+
+        Returns:
+            Path to the written file.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+_active_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the active tracer, or None when profiling is disabled."""
+    return _active_tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Set the active tracer. Pass None to disable profiling."""
+    global _active_tracer
+    _active_tracer = tracer
+
+
+def span(name: str, category: str = "app", always: bool = False, **args: Any):
+    """Create a span on the active tracer, or a no-op span when disabled."""
+    tracer = _active_tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, category, always, **args)
+
+
+def resource_span(name: str, category: str = "app", **args: Any):
+    """Create a sampled per-resource span on the active tracer, or a no-op span when disabled."""
+    tracer = _active_tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.resource_span(name, category, **args)
+
+
+@contextmanager
+def profiling_enabled(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """Make a tracer active for the duration of a block.
+
+    Passing None leaves profiling disabled. The previously active tracer is
+    restored afterwards.
+    """
+    previous = _active_tracer
+    set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+
+
+def traced(name: str, category: str = "app") -> Callable:
+    """Decorator recording a span around each call of a method.
+
+    The first positional argument after `self`, if any, is recorded as the
+    span's `resource`.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = _active_tracer
+            if tracer is None:
+                return func(self, *args, **kwargs)
+            span_args = {'resource': str(args[0])} if args and isinstance(args[0], str) else {}
+            with tracer.span(name, category, **span_args):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
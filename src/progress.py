@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+
+from .events import (
+    EventBus, ValidationEvent, RESOURCE_COMPLETED, RESOURCE_FAILED, RESOURCE_RESTORED,
+    RESOURCE_STARTED, SCAN_STARTED
+)
+
+
+class ProgressTracker:
+    """Aggregates validation events into throughput and progress figures.
+
+    Safe to feed from several threads at once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.started = 0
+        self.completed = 0
+        self.restored = 0
+        self.failed = 0
+        self.services: Dict[str, Dict[str, int]] = defaultdict(lambda: {'done': 0, 'errors': 0})
+        self._start_time: Optional[float] = None
+
+    def __call__(self, event: ValidationEvent) -> None:
+        """Record an event."""
+        with self._lock:
+            if event.kind == SCAN_STARTED:
+                self.total += event.total or 0
+                if self._start_time is None:
+                    self._start_time = event.timestamp
+            elif event.kind == RESOURCE_STARTED:
+                self.started += 1
+            elif event.kind == RESOURCE_COMPLETED:
+                self.completed += 1
+                self.services[event.service]['done'] += 1
+            elif event.kind == RESOURCE_FAILED:
+                self.failed += 1
+                self.services[event.service]['done'] += 1
+                self.services[event.service]['errors'] += 1
+            elif event.kind == RESOURCE_RESTORED:
+                self.restored += 1
+                self.services[event.service]['done'] += 1
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Get current progress figures.
+
+        Returns:
+            Dict with done/total counts, rate in resources per second,
+            in-flight requests, ETA in seconds, error count and a
+            per-service breakdown.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            validated = self.completed + self.failed
+            done = validated + self.restored
+            elapsed = now - self._start_time if self._start_time is not None else 0.0
+            rate = validated / elapsed if elapsed > 0 else 0.0
+            remaining = max(self.total - done, 0)
+            return {
+                'done': done,
+                'total': self.total,
+                'rate': rate,
+                'in_flight': self.started - validated,
+                'eta': remaining / rate if rate > 0 else None,
+                'errors': self.failed,
+                'elapsed': elapsed,
+                'services': {name: dict(counts) for name, counts in self.services.items()},
+            }
+
+
+class LiveProgress:
+    """Live console display of scan progress, driven by validator events.
+
+    Usage:
+        with LiveProgress(validator.events, console):
+            validator.validate_all(...)
+    """
+
+    def __init__(self, events: EventBus, console: Optional[Console] = None,
+                 refresh_per_second: float = 4):
+        self.events = events
+        self.tracker = ProgressTracker()
+        self._live = Live(self, console=console, refresh_per_second=refresh_per_second, transient=False)
+        self._unsubscribe = None
+
+    def __rich__(self) -> Group:
+        stats = self.tracker.snapshot()
+        eta = f"{stats['eta']:.0f}s" if stats['eta'] is not None else "-"
+
+        summary = Table.grid(padding=(0, 2))
+        summary.add_row(
+            f"[bold]{stats['done']}/{stats['total']}[/bold] resources",
+            f"{stats['rate']:.1f}/s",
+            f"in flight: {stats['in_flight']}",
+            f"ETA: {eta}",
+            f"[{'red' if stats['errors'] else 'green'}]errors: {stats['errors']}[/]"
+        )
+
+        services = Table(box=None, show_header=True, header_style="bold")
+        services.add_column("Service")
+        services.add_column("Done", justify="right")
+        services.add_column("Errors", justify="right")
+        for name, counts in sorted(stats['services'].items()):
+            services.add_row(name, str(counts['done']), str(counts['errors']))
+
+        return Group(summary, services)
+
+    def __enter__(self) -> "LiveProgress":
+        self._unsubscribe = self.events.subscribe(self.tracker)
+        self._live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._live.refresh()
+            self._live.__exit__(exc_type, exc, tb)
+        finally:
+            if self._unsubscribe:
+                self._unsubscribe()
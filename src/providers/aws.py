@@ -1,21 +1,175 @@
+import functools
+import threading
+
 import boto3
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from ..profiling import span, traced
+
+
+def _records_endpoint(service_name: str):
+    """Decorator adding whether a FIPS endpoint was used to encryption details."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            details = func(self, *args, **kwargs)
+            details['fips_endpoint'] = self.is_fips_endpoint(service_name)
+            return details
+        return wrapper
+    return decorator
+
+
+class _InFlightCall:
+    """A describe request in progress, shared by every caller asking for it."""
+    
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+def _coalesced(func):
+    """Decorator coalescing concurrent identical describe requests.
+    
+    The first caller for a resource makes the API call; callers asking for
+    the same resource while it is in flight wait for that call and share its
+    result or exception. Each caller gets its own copy of the result.
+    """
+    @functools.wraps(func)
+    def wrapper(self, resource_id: str) -> Dict[str, Any]:
+        key = (func.__name__, resource_id)
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _InFlightCall()
+        
+        if leader:
+            try:
+                call.result = func(self, resource_id)
+                return dict(call.result)
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._in_flight_lock:
+                    del self._in_flight[key]
+                call.done.set()
+        
+        with span('aws.coalesced_wait', 'aws', resource=resource_id):
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return dict(call.result)
+    return wrapper
+
+
 class AWSProvider:
     """AWS Cloud Provider implementation."""
     
-    def __init__(self, region_name: Optional[str] = None, profile: Optional[str] = None):
+    def __init__(self, region_name: Optional[str] = None, profile: Optional[str] = None,
+                 use_fips_endpoint: Optional[bool] = None):
         """Initialize AWS provider.
         
         Args:
             region_name: AWS region name.
             profile: AWS profile name.
+            use_fips_endpoint: Whether clients use FIPS 140 validated
+                endpoints. Defaults to the AWS configuration, e.g. the
+                `AWS_USE_FIPS_ENDPOINT` environment variable.
         """
         self.session = boto3.Session(region_name=region_name, profile_name=profile)
         self.region = region_name or self.session.region_name
+        self.client_config = None
+        if use_fips_endpoint is not None:
+            self.client_config = Config(use_fips_endpoint=use_fips_endpoint)
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._key_managers: Dict[str, Optional[str]] = {}
+        self._in_flight: Dict[tuple, _InFlightCall] = {}
+        self._in_flight_lock = threading.Lock()
+    
+    def get_client(self, service_name: str) -> Any:
+        """Get a cached boto3 client for a service.
+        
+        Clients are created once per provider and reused, so credential
+        resolution and endpoint setup only happen on first use.
+        
+        Args:
+            service_name: AWS service name (e.g. 's3').
+            
+        Returns:
+            A boto3 client for the service.
+        """
+        client = self._clients.get(service_name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    with span('aws.resolve_credentials', 'aws', always=True, service=service_name):
+                        self.session.get_credentials()
+                    with span('aws.create_client', 'aws', always=True, service=service_name):
+                        client = self.session.client(service_name, config=self.client_config)
+                    self._clients[service_name] = client
+        return client
+    
+    def is_fips_endpoint(self, service_name: str) -> bool:
+        """Check whether a service's client talks to a FIPS endpoint.
+        
+        Args:
+            service_name: AWS service name (e.g. 's3').
+            
+        FIPS mode is read from the client's resolved configuration, because
+        some FIPS endpoints (e.g. RDS in GovCloud) have no `-fips` in their
+        hostname. Explicitly configured `-fips` endpoint URLs also count.
+        
+        Returns:
+            True if the client's endpoint is a FIPS 140 validated endpoint.
+        """
+        meta = getattr(self.get_client(service_name), 'meta', None)
+        if getattr(getattr(meta, 'config', None), 'use_fips_endpoint', None):
+            return True
+        endpoint_url = getattr(meta, 'endpoint_url', None) or ''
+        return '-fips' in endpoint_url
+    
+    def get_kms_key_manager(self, key_id: str) -> Optional[str]:
+        """Get who manages a KMS key.
+        
+        Successful lookups are cached per key, since many resources share a
+        key. Failed lookups are not, so a throttled or denied request does
+        not decide the outcome for every later resource using the key.
+        
+        Args:
+            key_id: KMS key ID, key ARN or alias.
+            
+        Returns:
+            'AWS' for AWS managed keys, 'CUSTOMER' for customer managed keys,
+            or None if the key could not be described.
+        """
+        if key_id in self._key_managers:
+            return self._key_managers[key_id]
+        if key_id.startswith('alias/aws/') or ':alias/aws/' in key_id:
+            key_manager = 'AWS'
+        else:
+            try:
+                kms_client = self.get_client('kms')
+                with span('aws.kms.describe_key', 'aws', resource=key_id):
+                    response = kms_client.describe_key(KeyId=key_id)
+                key_manager = response.get('KeyMetadata', {}).get('KeyManager')
+            except ClientError:
+                return None
+        if key_manager is not None:
+            self._key_managers[key_id] = key_manager
+        return key_manager
     
+    @traced('aws.get_s3_bucket_encryption', 'aws')
+    @_coalesced
+    @_records_endpoint('s3')
     def get_s3_bucket_encryption(self, bucket_name: str) -> Dict[str, Any]:
         """Get encryption configuration for an S3 bucket.
         
@@ -25,7 +179,7 @@ class AWSProvider:
         Returns:
             Dict containing encryption details or None if unencrypted.
         """
-        s3_client = self.session.client('s3')
+        s3_client = self.get_client('s3')
         try:
             response = s3_client.get_bucket_encryption(Bucket=bucket_name)
             rules = response.get('ServerSideEncryptionConfiguration', {}).get('Rules', [])
@@ -41,16 +195,22 @@ class AWSProvider:
                 return {
                     'status': 'encrypted',
                     'type': 'server_side',
-                    'algorithm': 'AES256'
+                    'algorithm': 'AES256',
+                    'key_manager': 'AWS'
                 }
             elif sse_algorithm == 'aws:kms':
-                key_type = 'aws_managed' if not kms_key_id else 'customer_managed'
+                # Without a key ID the bucket uses the AWS managed aws/s3 key.
+                # A key KMS cannot describe keeps its key ID based label, and
+                # policies requiring a known key manager fail it
+                key_manager = self.get_kms_key_manager(kms_key_id) if kms_key_id else 'AWS'
+                key_type = 'aws_managed' if key_manager == 'AWS' else 'customer_managed'
                 return {
                     'status': 'encrypted',
                     'type': 'customer_managed_key' if key_type == 'customer_managed' else 'server_side',
                     'algorithm': 'aws:kms',
                     'key_id': kms_key_id,
-                    'key_type': key_type
+                    'key_type': key_type,
+                    'key_manager': key_manager
                 }
             else:
                 return {'status': 'unknown', 'algorithm': sse_algorithm}
@@ -60,6 +220,9 @@ class AWSProvider:
                 return {'status': 'unencrypted'}
             raise
     
+    @traced('aws.get_dynamodb_encryption', 'aws')
+    @_coalesced
+    @_records_endpoint('dynamodb')
     def get_dynamodb_encryption(self, table_name: str) -> Dict[str, Any]:
         """Get encryption configuration for a DynamoDB table.
         
@@ -69,7 +232,7 @@ class AWSProvider:
         Returns:
             Dict containing encryption details.
         """
-        dynamodb_client = self.session.client('dynamodb')
+        dynamodb_client = self.get_client('dynamodb')
         try:
             response = dynamodb_client.describe_table(TableName=table_name)
             table_info = response.get('Table', {})
@@ -82,28 +245,38 @@ class AWSProvider:
             kms_key_id = sse_desc.get('KMSMasterKeyArn')
             
             if status == 'ENABLED':
-                if sse_type == 'KMS' and kms_key_id:
+                # KMS encryption may use the AWS managed aws/dynamodb key
+                uses_kms_key = sse_type == 'KMS' and kms_key_id
+                key_manager = self.get_kms_key_manager(kms_key_id) if uses_kms_key else 'AWS'
+                if key_manager != 'AWS':
                     return {
                         'status': 'encrypted',
                         'type': 'customer_managed_key',
-                        'key_id': kms_key_id
+                        'key_id': kms_key_id,
+                        'key_manager': key_manager
                     }
                 else:
                     return {
                         'status': 'encrypted',
-                        'type': 'server_side'
+                        'type': 'server_side',
+                        'key_id': kms_key_id,
+                        'key_manager': key_manager
                     }
             else:
                 # All DynamoDB tables are encrypted with AWS owned keys by default
                 return {
                     'status': 'encrypted',
                     'type': 'server_side',
-                    'note': 'Default AWS owned key encryption'
+                    'note': 'Default AWS owned key encryption',
+                    'key_manager': 'AWS'
                 }
                 
         except ClientError:
             raise
     
+    @traced('aws.get_rds_encryption', 'aws')
+    @_coalesced
+    @_records_endpoint('rds')
     def get_rds_encryption(self, db_identifier: str) -> Dict[str, Any]:
         """Get encryption configuration for an RDS database.
         
@@ -113,7 +286,7 @@ class AWSProvider:
         Returns:
             Dict containing encryption details.
         """
-        rds_client = self.session.client('rds')
+        rds_client = self.get_client('rds')
         try:
             response = rds_client.describe_db_instances(DBInstanceIdentifier=db_identifier)
             instances = response.get('DBInstances', [])
@@ -126,19 +299,61 @@ class AWSProvider:
             kms_key_id = instance.get('KmsKeyId')
             
             if storage_encrypted:
-                if kms_key_id:
+                # The default aws/rds key also sets KmsKeyId, so ask KMS who manages it
+                key_manager = self.get_kms_key_manager(kms_key_id) if kms_key_id else 'AWS'
+                if key_manager != 'AWS':
                     return {
                         'status': 'encrypted',
                         'type': 'customer_managed_key',
-                        'key_id': kms_key_id
+                        'key_id': kms_key_id,
+                        'key_manager': key_manager
                     }
                 else:
                     return {
                         'status': 'encrypted',
-                        'type': 'server_side'
+                        'type': 'server_side',
+                        'key_id': kms_key_id,
+                        'key_manager': key_manager
                     }
             else:
                 return {'status': 'unencrypted'}
                 
         except ClientError:
-            raise
\ No newline at end of file
+            raise
+    
+    @traced('aws.list_s3_buckets', 'aws')
+    def list_s3_buckets(self) -> List[str]:
+        """List the names of all S3 buckets in the account.
+        
+        Returns:
+            List of bucket names.
+        """
+        s3_client = self.get_client('s3')
+        response = s3_client.list_buckets()
+        return [bucket['Name'] for bucket in response.get('Buckets', [])]
+    
+    @traced('aws.list_dynamodb_tables', 'aws')
+    def list_dynamodb_tables(self) -> List[str]:
+        """List the names of all DynamoDB tables in the region.
+        
+        Returns:
+            List of table names.
+        """
+        dynamodb_client = self.get_client('dynamodb')
+        paginator = dynamodb_client.get_paginator('list_tables')
+        return [name for page in paginator.paginate() for name in page.get('TableNames', [])]
+    
+    @traced('aws.list_rds_instances', 'aws')
+    def list_rds_instances(self) -> List[str]:
+        """List the identifiers of all RDS instances in the region.
+        
+        Returns:
+            List of DB instance identifiers.
+        """
+        rds_client = self.get_client('rds')
+        paginator = rds_client.get_paginator('describe_db_instances')
+        return [
+            instance['DBInstanceIdentifier']
+            for page in paginator.paginate()
+            for instance in page.get('DBInstances', [])
+        ]
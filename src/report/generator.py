@@ -1,10 +1,26 @@
 import json
 import csv
+import io
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 from ..models import ValidationResult
+from ..profiling import traced
+
+
+def _dumps_nested(value: Any, level: int) -> str:
+    """Encode a value as indented JSON for nesting `level` levels deep."""
+    return json.dumps(value, indent=2, default=str).replace('\n', '\n' + '  ' * level)
+
+
+def _iter_json_list(items: Iterable[Any], level: int) -> Iterator[str]:
+    """Encode a list one item at a time, as `json.dumps(..., indent=2)` would."""
+    separator = '[\n'
+    for item in items:
+        yield separator + '  ' * (level + 1) + _dumps_nested(item, level + 1)
+        separator = ',\n'
+    yield '[]' if separator == '[\n' else '\n' + '  ' * level + ']'
 
 
 class ReportGenerator:
@@ -19,6 +35,45 @@ class ReportGenerator:
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.output_dir.mkdir(exist_ok=True, parents=True)
     
+    def iter_json(self, result: ValidationResult) -> Iterator[str]:
+        """Render a JSON report in chunks.
+        
+        Locations and errors are encoded one at a time, so a large report
+        can be written or uploaded without holding all of it in memory.
+        The concatenated chunks equal `render_json`.
+        
+        Args:
+            result: The validation result.
+            
+        Yields:
+            Consecutive pieces of the JSON report.
+        """
+        separator = '{\n'
+        for field in type(result).model_fields:
+            yield f"{separator}  {json.dumps(field)}: "
+            separator = ',\n'
+            value = getattr(result, field)
+            if field == 'storage_locations':
+                yield from _iter_json_list((location.model_dump() for location in value), 1)
+            elif field == 'errors':
+                yield from _iter_json_list(value, 1)
+            else:
+                yield _dumps_nested(value, 1)
+        yield '\n}'
+    
+    @traced('report.render_json', 'report')
+    def render_json(self, result: ValidationResult) -> str:
+        """Render a JSON report to a string.
+        
+        Args:
+            result: The validation result.
+            
+        Returns:
+            The JSON report contents.
+        """
+        return ''.join(self.iter_json(result))
+    
+    @traced('report.generate_json', 'report')
     def generate_json(self, result: ValidationResult, filename: Optional[str] = None) -> str:
         """Generate a JSON report.
         
@@ -35,12 +90,44 @@ class ReportGenerator:
             
         filepath = self.output_dir / filename
         
-        # Convert to dictionary and write to file
         with open(filepath, 'w') as f:
-            json.dump(result.dict(), f, indent=2, default=str)
+            f.writelines(self.iter_json(result))
             
         return str(filepath)
     
+    @traced('report.render_csv', 'report')
+    def render_csv(self, result: ValidationResult) -> str:
+        """Render a CSV report to a string.
+        
+        Args:
+            result: The validation result.
+            
+        Returns:
+            The CSV report contents.
+        """
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        # Write header
+        writer.writerow([
+            'ID', 'Name', 'Type', 'Provider', 'Region', 
+            'Encryption Type', 'Compliant'
+        ])
+        
+        # Write data rows
+        for location in result.storage_locations:
+            writer.writerow([
+                location.id,
+                location.name,
+                location.type,
+                location.provider,
+                location.region or '',
+                location.encryption_type,
+                location.compliant
+            ])
+            
+        return buffer.getvalue()
+    
+    @traced('report.generate_csv', 'report')
     def generate_csv(self, result: ValidationResult, filename: Optional[str] = None) -> str:
         """Generate a CSV report.
         
@@ -59,27 +146,51 @@ class ReportGenerator:
         
         # Write locations to CSV
         with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f)
-            # Write header
-            writer.writerow([
-                'ID', 'Name', 'Type', 'Provider', 'Region', 
-                'Encryption Type', 'Compliant'
-            ])
-            
-            # Write data rows
-            for location in result.storage_locations:
-                writer.writerow([
-                    location.id,
-                    location.name,
-                    location.type,
-                    location.provider,
-                    location.region or '',
-                    location.encryption_type,
-                    location.compliant
-                ])
+            f.write(self.render_csv(result))
                 
         return str(filepath)
     
+    def iter_summary(self, result: ValidationResult) -> Iterator[str]:
+        """Render a summary text report in chunks, one error line at a time.
+        
+        Args:
+            result: The validation result.
+            
+        Yields:
+            Consecutive pieces of the summary report.
+        """
+        yield f"FedRAMP Encryption Validation Summary\n"
+        yield f"Generated: {datetime.now().isoformat()}\n\n"
+        
+        yield f"Overall Status: {'COMPLIANT' if result.all_encrypted else 'NON-COMPLIANT'}\n\n"
+        
+        yield f"Storage Locations: {len(result.storage_locations)}\n"
+        object_storage_count = sum(1 for loc in result.storage_locations if loc.type == 'object_storage')
+        database_count = sum(1 for loc in result.storage_locations if loc.type == 'database')
+        yield f" - Object Storage: {object_storage_count}\n"
+        yield f" - Databases: {database_count}\n\n"
+        
+        compliant_count = sum(1 for loc in result.storage_locations if loc.compliant)
+        yield f"Compliant Locations: {compliant_count}/{len(result.storage_locations)}\n\n"
+        
+        if result.errors:
+            yield f"Errors: {len(result.errors)}\n"
+            for error in result.errors:
+                yield f" - {error['resource_id']}: {error['error_message']}\n"
+    
+    @traced('report.render_summary', 'report')
+    def render_summary(self, result: ValidationResult) -> str:
+        """Render a summary text report to a string.
+        
+        Args:
+            result: The validation result.
+            
+        Returns:
+            The summary report contents.
+        """
+        return ''.join(self.iter_summary(result))
+    
+    @traced('report.generate_summary', 'report')
     def generate_summary(self, result: ValidationResult, filename: Optional[str] = None) -> str:
         """Generate a summary text report.
         
@@ -97,23 +208,6 @@ class ReportGenerator:
         filepath = self.output_dir / filename
         
         with open(filepath, 'w') as f:
-            f.write(f"FedRAMP Encryption Validation Summary\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n\n")
-            
-            f.write(f"Overall Status: {'COMPLIANT' if result.all_encrypted else 'NON-COMPLIANT'}\n\n")
-            
-            f.write(f"Storage Locations: {len(result.storage_locations)}\n")
-            object_storage_count = sum(1 for loc in result.storage_locations if loc.type == 'object_storage')
-            database_count = sum(1 for loc in result.storage_locations if loc.type == 'database')
-            f.write(f" - Object Storage: {object_storage_count}\n")
-            f.write(f" - Databases: {database_count}\n\n")
-            
-            compliant_count = sum(1 for loc in result.storage_locations if loc.compliant)
-            f.write(f"Compliant Locations: {compliant_count}/{len(result.storage_locations)}\n\n")
-            
-            if result.errors:
-                f.write(f"Errors: {len(result.errors)}\n")
-                for error in result.errors:
-                    f.write(f" - {error['resource_id']}: {error['error_message']}\n")
+            f.writelines(self.iter_summary(result))
             
         return str(filepath)
\ No newline at end of file
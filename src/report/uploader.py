@@ -0,0 +1,146 @@
+import io
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from boto3.s3.transfer import TransferConfig
+
+from ..profiling import span
+
+
+# Defaults tuned for report-sized objects: small enough that medium reports
+# are split into parts, with parts uploaded in parallel.
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only stream encoding report chunks as they are consumed.
+
+    Only the chunk being read is held in memory, so the transfer manager
+    can upload a report while it is still being rendered.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks: Iterator[str] = iter(chunks)
+        self._data = b''
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._data):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._data = chunk.encode('utf-8')
+            self._offset = 0
+        size = min(len(buffer), len(self._data) - self._offset)
+        buffer[:size] = self._data[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+class S3ReportUploader:
+    """Uploads rendered reports straight to S3 without touching local disk.
+
+    Each upload runs in the background using the S3 transfer manager, which
+    switches to multipart upload with concurrent parts above the configured
+    threshold. Reports given as chunk iterables are encoded while they are
+    uploaded, so a large report never exists in memory in full. Callers can
+    keep rendering further reports while earlier ones are in flight and call
+    `wait` once everything has been submitted.
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, prefix: str = "reports/",
+                 multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+                 multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Initialize the uploader.
+
+        Args:
+            s3_client: boto3 S3 client to upload with.
+            bucket: Destination bucket name.
+            prefix: Key prefix for uploaded reports.
+            multipart_threshold: Size in bytes above which multipart upload is used.
+            multipart_chunksize: Size in bytes of each multipart part.
+            max_concurrency: Maximum number of parts uploaded concurrently.
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=True
+        )
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._futures: List[Future] = []
+
+    def key_for(self, filename: str) -> str:
+        """Get the S3 key a report filename will be uploaded to."""
+        return f"{self.prefix}{filename}"
+
+    def uri_for(self, filename: str) -> str:
+        """Get the S3 URI a report filename will be uploaded to."""
+        return f"s3://{self.bucket}/{self.key_for(filename)}"
+
+    def upload(self, filename: str, content: Union[str, Iterable[str]],
+               content_type: Optional[str] = None) -> Future:
+        """Start uploading a report in the background.
+
+        Args:
+            filename: Report filename, appended to the key prefix.
+            content: Report contents, or an iterable of chunks such as
+                `ReportGenerator.iter_json`, which is consumed by the upload.
+            content_type: Optional Content-Type for the object.
+
+        Returns:
+            Future resolving to the S3 URI once the upload completes.
+        """
+        if isinstance(content, str):
+            fileobj: BinaryIO = io.BytesIO(content.encode('utf-8'))
+        else:
+            fileobj = io.BufferedReader(_ChunkReader(content), buffer_size=io.DEFAULT_BUFFER_SIZE * 16)
+        extra_args = {'ContentType': content_type} if content_type else None
+        future = self._executor.submit(self._upload, filename, fileobj, extra_args)
+        self._futures.append(future)
+        return future
+
+    def _upload(self, filename: str, fileobj: BinaryIO, extra_args: Optional[dict]) -> str:
+        """Upload a report stream using the transfer manager."""
+        with span('report.s3_upload', 'report', key=self.key_for(filename)):
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.bucket,
+                self.key_for(filename),
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
+            )
+        return self.uri_for(filename)
+
+    def wait(self) -> List[str]:
+        """Wait for all submitted uploads to finish.
+
+        Returns:
+            S3 URIs of the uploaded reports, in submission order.
+
+        Raises:
+            Exception: The first upload failure, if any upload failed.
+        """
+        try:
+            return [future.result() for future in self._futures]
+        finally:
+            self._futures = []
+
+    def close(self) -> None:
+        """Shut down the background upload threads."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "S3ReportUploader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -1,6 +1,8 @@
 from typing import Dict, Optional, Any
 
-from ..models import EncryptionType, ResourceType, StorageLocation
+from ..models import ResourceType, StorageLocation
+from ..policy.engine import Policy, classify_encryption, load_policy
+from ..profiling import span
 from ..providers.aws import AWSProvider
 from .base import BaseValidator
 
@@ -8,16 +10,63 @@ from .base import BaseValidator
 class AWSValidator(BaseValidator):
     """AWS implementation of the validator."""
     
-    def __init__(self, region_name: Optional[str] = None, profile: Optional[str] = None):
+    def __init__(self, region_name: Optional[str] = None, profile: Optional[str] = None,
+                 policy: Optional[Policy] = None, use_fips_endpoint: Optional[bool] = None):
         """Initialize the AWS validator.
         
         Args:
             region_name: AWS region name.
             profile: AWS profile name.
+            policy: Compliance policy. Defaults to the built-in 'default' policy.
+            use_fips_endpoint: Whether to use FIPS 140 validated endpoints.
+                Defaults to the AWS configuration.
         """
         super().__init__(provider_name="aws")
-        self.aws = AWSProvider(region_name=region_name, profile=profile)
+        self.aws = AWSProvider(region_name=region_name, profile=profile, use_fips_endpoint=use_fips_endpoint)
         self.region = region_name or self.aws.region
+        self.policy = policy or load_policy()
+    
+    def service_name(self, resource_type: ResourceType, location_id: str, **kwargs) -> str:
+        """Get the AWS service a resource belongs to ('s3', 'dynamodb' or 'rds')."""
+        if resource_type == ResourceType.OBJECT_STORAGE:
+            return 's3'
+        db_type = kwargs.get('db_type', 'dynamodb')
+        return db_type(location_id) if callable(db_type) else db_type
+    
+    def restore_location(self, location: StorageLocation) -> StorageLocation:
+        """Re-evaluate a restored location against this validator's policy.
+        
+        The journal may have been written under another policy, so
+        compliance is recomputed offline from the recorded encryption
+        details rather than trusted.
+        """
+        with span('policy.evaluate', 'policy'):
+            compliant = self.policy.evaluate(
+                location.type.value, location.provider, location.region, location.encryption_details
+            )
+        if location.compliant != compliant:
+            location.compliant = compliant
+        return location
+    
+    def _build_location(self, location_id: str, resource_type: ResourceType,
+                        encryption_info: Dict[str, Any]) -> StorageLocation:
+        """Build a storage location, evaluating compliance against the policy."""
+        with span('policy.evaluate', 'policy'):
+            compliant = self.policy.evaluate(
+                resource_type.value, self.provider_name, self.region, encryption_info
+            )
+        
+        with span('model.StorageLocation', 'pydantic'):
+            return StorageLocation(
+                id=location_id,
+                name=location_id,
+                type=resource_type,
+                provider=self.provider_name,
+                region=self.region,
+                encryption_type=classify_encryption(encryption_info),
+                encryption_details=encryption_info,
+                compliant=compliant
+            )
     
     def validate_object_storage(self, location_id: str, **kwargs) -> StorageLocation:
         """Validate encryption for an S3 bucket.
@@ -30,41 +79,22 @@ class AWSValidator(BaseValidator):
         """
         encryption_info = self.aws.get_s3_bucket_encryption(location_id)
         
-        # Determine encryption type
-        encryption_type = EncryptionType.NONE
-        compliant = False
-        
-        if encryption_info.get('status') == 'encrypted':
-            encryption_type_str = encryption_info.get('type')
-            if encryption_type_str == 'server_side':
-                encryption_type = EncryptionType.SERVER_SIDE
-                compliant = True
-            elif encryption_type_str == 'customer_managed_key':
-                encryption_type = EncryptionType.CUSTOMER_MANAGED_KEY
-                compliant = True
-        
-        return StorageLocation(
-            id=location_id,
-            name=location_id,
-            type=ResourceType.OBJECT_STORAGE,
-            provider=self.provider_name,
-            region=self.region,
-            encryption_type=encryption_type,
-            encryption_details=encryption_info,
-            compliant=compliant
-        )
+        return self._build_location(location_id, ResourceType.OBJECT_STORAGE, encryption_info)
     
     def validate_database(self, location_id: str, **kwargs) -> StorageLocation:
         """Validate encryption for a database.
         
         Args:
             location_id: Database identifier.
-            db_type: Type of database ('dynamodb' or 'rds')
+            db_type: Type of database ('dynamodb' or 'rds'), or a callable
+                mapping the database identifier to its type.
             
         Returns:
             StorageLocation: Details about the validated database.
         """
         db_type = kwargs.get('db_type', 'dynamodb')
+        if callable(db_type):
+            db_type = db_type(location_id)
         
         if db_type == 'dynamodb':
             encryption_info = self.aws.get_dynamodb_encryption(location_id)
@@ -73,26 +103,4 @@ class AWSValidator(BaseValidator):
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
         
-        # Determine encryption type
-        encryption_type = EncryptionType.NONE
-        compliant = False
-        
-        if encryption_info.get('status') == 'encrypted':
-            encryption_type_str = encryption_info.get('type')
-            if encryption_type_str == 'server_side':
-                encryption_type = EncryptionType.SERVER_SIDE
-                compliant = True
-            elif encryption_type_str == 'customer_managed_key':
-                encryption_type = EncryptionType.CUSTOMER_MANAGED_KEY
-                compliant = True
-        
-        return StorageLocation(
-            id=location_id,
-            name=location_id,
-            type=ResourceType.DATABASE,
-            provider=self.provider_name,
-            region=self.region,
-            encryption_type=encryption_type,
-            encryption_details=encryption_info,
-            compliant=compliant
-        )
\ No newline at end of file
+        return self._build_location(location_id, ResourceType.DATABASE, encryption_info)
\ No newline at end of file
@@ -1,7 +1,14 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Union
 
+from ..checkpoint import Checkpoint, checkpoint_key
+from ..events import (
+    EventBus, RESOURCE_COMPLETED, RESOURCE_FAILED, RESOURCE_RESTORED, RESOURCE_STARTED,
+    SCAN_FINISHED, SCAN_STARTED
+)
 from ..models import ResourceType, StorageLocation, ValidationResult
+from ..profiling import resource_span
 
 
 class BaseValidator(ABC):
@@ -15,6 +22,32 @@ class BaseValidator(ABC):
         """
         self.provider_name = provider_name
         self.result = ValidationResult()
+        self.events = EventBus()
+    
+    def service_name(self, resource_type: ResourceType, location_id: str, **kwargs) -> str:
+        """Get the service a resource belongs to, for progress reporting.
+        
+        Args:
+            resource_type: Type of the resource.
+            location_id: Identifier for the resource.
+            **kwargs: Additional arguments passed to validation.
+            
+        Returns:
+            The service name. Defaults to the resource type.
+        """
+        return resource_type.value
+    
+    def restore_location(self, location: StorageLocation) -> StorageLocation:
+        """Prepare a location restored from a checkpoint for this scan.
+        
+        Args:
+            location: Location recorded by an earlier, interrupted scan.
+            
+        Returns:
+            StorageLocation: The location to report. Defaults to the
+            recorded location unchanged.
+        """
+        return location
     
     @abstractmethod
     def validate_object_storage(self, location_id: str, **kwargs) -> StorageLocation:
@@ -42,31 +75,100 @@ class BaseValidator(ABC):
         """
         pass
     
-    def validate_all(self, object_storage_ids: List[str], database_ids: List[str], **kwargs) -> ValidationResult:
+    def validate_all(self, object_storage_ids: List[str], database_ids: List[str],
+                     checkpoint: Optional[Checkpoint] = None, deadline: Optional[float] = None,
+                     **kwargs) -> ValidationResult:
         """Validate all resources.
         
         Args:
             object_storage_ids: List of object storage identifiers.
             database_ids: List of database identifiers.
+            checkpoint: Optional journal of completed resources. Resources
+                already in the journal are restored instead of revalidated.
+            deadline: Optional `time.time()` value after which validation
+                stops early, leaving the remainder to a resumed run.
             **kwargs: Additional arguments needed for validation.
             
         Returns:
-            ValidationResult: The validation results.
+            ValidationResult: The validation results. A resource listed more
+            than once is validated once, and its location or error is
+            repeated for each occurrence.
         """
-        # Validate object storage
-        for storage_id in object_storage_ids:
-            try:
-                location = self.validate_object_storage(storage_id, **kwargs)
-                self.result.add_location(location)
-            except Exception as e:
-                self.result.add_error(storage_id, str(e))
+        completed = checkpoint.completed() if checkpoint else {}
+        resources = [
+            (ResourceType.OBJECT_STORAGE, storage_id, self.validate_object_storage)
+            for storage_id in object_storage_ids
+        ] + [
+            (ResourceType.DATABASE, db_id, self.validate_database)
+            for db_id in database_ids
+        ]
+        
+        keys = [
+            checkpoint_key(resource_type.value, resource_id)
+            for resource_type, resource_id, _ in resources
+        ]
+        total = len(set(keys))
         
-        # Validate databases
-        for db_id in database_ids:
-            try:
-                location = self.validate_database(db_id, **kwargs)
-                self.result.add_location(location)
-            except Exception as e:
-                self.result.add_error(db_id, str(e))
+        events = self.events
+        if events.active:
+            events.emit(SCAN_STARTED, total=total)
+        
+        # Outcome of each resource seen so far: a location, or an error message
+        outcomes: Dict[str, Union[StorageLocation, str]] = {}
+        skipped: Set[str] = set()
+        try:
+            for key, (resource_type, resource_id, validate) in zip(keys, resources):
+                # Duplicates reuse the first occurrence's outcome
+                outcome = outcomes.get(key)
+                if isinstance(outcome, StorageLocation):
+                    self.result.add_location(outcome)
+                    continue
+                if outcome is not None:
+                    self.result.add_error(resource_id, outcome)
+                    continue
+                
+                emitting = events.active
+                service = self.service_name(resource_type, resource_id, **kwargs) if emitting else None
+                if key in completed:
+                    location = self.restore_location(completed[key])
+                    outcomes[key] = location
+                    self.result.add_location(location)
+                    if emitting:
+                        events.emit(RESOURCE_RESTORED, resource_id=resource_id, service=service,
+                                    location=location)
+                    continue
+                
+                if deadline is not None and (skipped or time.time() >= deadline):
+                    skipped.add(key)
+                    continue
+                
+                if emitting:
+                    events.emit(RESOURCE_STARTED, resource_id=resource_id, service=service)
+                try:
+                    with resource_span(f"validate.{resource_type.value}", 'validate', resource=resource_id):
+                        location = validate(resource_id, **kwargs)
+                    outcomes[key] = location
+                    self.result.add_location(location)
+                except Exception as e:
+                    outcomes[key] = str(e)
+                    self.result.add_error(resource_id, str(e))
+                    if emitting:
+                        events.emit(RESOURCE_FAILED, resource_id=resource_id, service=service, error=str(e))
+                    continue
+                
+                if emitting:
+                    events.emit(RESOURCE_COMPLETED, resource_id=resource_id, service=service,
+                                location=location)
+                if checkpoint:
+                    checkpoint.record(key, location)
+            
+            if skipped:
+                self.result.not_validated += len(skipped)
+                self.result.add_error("scan", f"Stopped at deadline with {len(skipped)} resources not validated")
+        finally:
+            if checkpoint:
+                checkpoint.flush()
+            if events.active:
+                events.emit(SCAN_FINISHED, total=total)
                 
-        return self.result
\ No newline at end of file
+        return self.result
@@ -0,0 +1,52 @@
+from src.models import EncryptionType, ResourceType, StorageLocation
+from src.profiling import span
+from src.validators.base import BaseValidator
+
+
+class StubValidator(BaseValidator):
+    """Validator returning canned results without calling a cloud API.
+
+    Args:
+        failing: Resource IDs whose check fails with "Access denied".
+        fail_after: Number of resources after which the scan is interrupted,
+            as if the process were killed.
+    """
+
+    def __init__(self, failing=('broken',), fail_after=None):
+        super().__init__(provider_name="aws")
+        self.failing = set(failing)
+        self.fail_after = fail_after
+        self.calls = []
+
+    def _check(self, location_id):
+        """Record a call, failing where configured."""
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise KeyboardInterrupt()
+        self.calls.append(location_id)
+        if location_id in self.failing:
+            raise ValueError("Access denied")
+
+    def validate_object_storage(self, location_id, **kwargs):
+        with span('aws.s3.get_bucket_encryption', 'aws', resource=location_id):
+            self._check(location_id)
+        return StorageLocation(
+            id=location_id,
+            name=location_id,
+            type=ResourceType.OBJECT_STORAGE,
+            provider=self.provider_name,
+            encryption_type=EncryptionType.SERVER_SIDE,
+            compliant=True
+        )
+
+    def validate_database(self, location_id, **kwargs):
+        self._check(location_id)
+        db_type = kwargs.get('db_type')
+        return StorageLocation(
+            id=location_id,
+            name=location_id,
+            type=ResourceType.DATABASE,
+            provider=self.provider_name,
+            encryption_type=EncryptionType.SERVER_SIDE,
+            encryption_details={'db_type': db_type(location_id)} if db_type else None,
+            compliant=True
+        )
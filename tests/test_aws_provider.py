@@ -0,0 +1,99 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from src.profiling import Tracer, profiling_enabled
+from src.providers.aws import AWSProvider
+
+
+AWS_RDS_KEY = 'arn:aws-us-gov:kms:us-gov-west-1:123456789012:key/aws-rds-default'
+CUSTOMER_KEY = 'arn:aws-us-gov:kms:us-gov-west-1:123456789012:key/customer-key'
+
+
+def describe_key(KeyId):
+    managers = {AWS_RDS_KEY: 'AWS', CUSTOMER_KEY: 'CUSTOMER'}
+    if KeyId not in managers:
+        raise ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}}, 'DescribeKey')
+    return {'KeyMetadata': {'KeyId': KeyId, 'KeyManager': managers[KeyId]}}
+
+
+class TestAWSProvider(unittest.TestCase):
+    """Test cases for FIPS endpoint detection and key manager lookup."""
+
+    def setUp(self):
+        self.provider = AWSProvider(region_name='us-gov-west-1')
+        self.kms = MagicMock()
+        self.kms.describe_key.side_effect = describe_key
+        self.rds = MagicMock()
+        self.provider._clients.update({'kms': self.kms, 'rds': self.rds})
+
+    def rds_details(self, kms_key_id):
+        self.rds.describe_db_instances.return_value = {
+            'DBInstances': [{'StorageEncrypted': True, 'KmsKeyId': kms_key_id}]
+        }
+        return self.provider.get_rds_encryption('db-1')
+
+    def test_fips_detected_from_client_config(self):
+        """Test that GovCloud RDS counts as FIPS although its hostname has no '-fips'."""
+        with patch.dict(os.environ, {'AWS_USE_FIPS_ENDPOINT': 'false'}):
+            fips = AWSProvider(region_name='us-gov-west-1', use_fips_endpoint=True)
+            default = AWSProvider(region_name='us-gov-west-1')
+
+            self.assertNotIn('-fips', fips.get_client('rds').meta.endpoint_url)
+            self.assertTrue(fips.is_fips_endpoint('rds'))
+            self.assertFalse(default.is_fips_endpoint('rds'))
+
+    def test_fips_enabled_by_environment(self):
+        """Test that AWS_USE_FIPS_ENDPOINT is honoured without the flag."""
+        with patch.dict(os.environ, {'AWS_USE_FIPS_ENDPOINT': 'true'}):
+            self.assertTrue(AWSProvider(region_name='us-gov-west-1').is_fips_endpoint('rds'))
+
+    def test_aws_managed_rds_key_is_not_customer_managed(self):
+        """Test that the default aws/rds key is labelled as AWS managed."""
+        details = self.rds_details(AWS_RDS_KEY)
+
+        self.assertEqual(details['type'], 'server_side')
+        self.assertEqual(details['key_manager'], 'AWS')
+        self.assertEqual(details['key_id'], AWS_RDS_KEY)
+
+    def test_customer_managed_key(self):
+        """Test that a customer managed key is labelled as such and looked up once."""
+        self.assertEqual(self.rds_details(CUSTOMER_KEY)['type'], 'customer_managed_key')
+        self.assertEqual(self.rds_details(CUSTOMER_KEY)['key_manager'], 'CUSTOMER')
+        self.kms.describe_key.assert_called_once_with(KeyId=CUSTOMER_KEY)
+
+    def test_undescribable_key_has_no_key_manager(self):
+        """Test that a key KMS will not describe keeps its key ID based label."""
+        details = self.rds_details('arn:aws-us-gov:kms:us-gov-west-1:123456789012:key/other')
+
+        self.assertIsNone(details['key_manager'])
+        self.assertEqual(details['type'], 'customer_managed_key')
+
+    def test_failed_lookup_is_retried(self):
+        """Test that a throttled lookup does not label the key for the rest of the run."""
+        throttled = ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'slow down'}}, 'DescribeKey')
+        self.kms.describe_key.side_effect = [throttled, describe_key(KeyId=AWS_RDS_KEY)]
+
+        self.assertIsNone(self.rds_details(AWS_RDS_KEY)['key_manager'])
+        self.assertEqual(self.rds_details(AWS_RDS_KEY)['key_manager'], 'AWS')
+        self.assertEqual(self.kms.describe_key.call_count, 2)
+
+    def test_key_lookup_is_traced(self):
+        """Test that DescribeKey gets its own span."""
+        tracer = Tracer()
+        with profiling_enabled(tracer):
+            self.provider.get_kms_key_manager(CUSTOMER_KEY)
+
+        self.assertEqual(tracer.events[0]['name'], 'aws.kms.describe_key')
+        self.assertEqual(tracer.events[0]['args'], {'resource': CUSTOMER_KEY})
+
+    def test_aws_alias_needs_no_lookup(self):
+        """Test that AWS managed key aliases are recognised without calling KMS."""
+        self.assertEqual(self.provider.get_kms_key_manager('alias/aws/dynamodb'), 'AWS')
+        self.kms.describe_key.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
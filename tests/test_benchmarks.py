@@ -0,0 +1,50 @@
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from benchmarks.run import build_inventory, compare, main, run_case, run_isolated
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the offline replay benchmark harness."""
+
+    def test_run_case_offline(self):
+        """Test that a small benchmark case runs against replayed responses."""
+        case = run_case(50, latency_ms=0.0, throttle_rate=0.0, recording=None, seed=0)
+
+        self.assertEqual(case['size'], 50)
+        # One describe call per resource, plus one KMS lookup for the shared key
+        self.assertEqual(case['api_calls'], 51)
+        self.assertEqual(case['locations'] + case['errors'], 50)
+        self.assertEqual(set(case['report_seconds']), {'json', 'csv', 'summary'})
+
+    def test_throttle_injection_surfaces_errors(self):
+        """Test that throttled calls are reported as errors."""
+        case = run_case(50, latency_ms=0.0, throttle_rate=1.0, recording=None, seed=0)
+
+        self.assertEqual(case['errors'], 50)
+
+    def test_inventory_and_compare(self):
+        """Test inventory sizing and regression detection."""
+        buckets, database_ids, database_types = build_inventory(10)
+        self.assertEqual(len(buckets) + len(database_ids), 10)
+        self.assertEqual(set(database_types.values()), {'dynamodb', 'rds'})
+
+        baseline = {'results': [{'size': 10, 'latency_ms': 0.0, 'throttle_rate': 0.0,
+                                 'resources_per_second': 1000.0}]}
+        current = [{'size': 10, 'latency_ms': 0.0, 'throttle_rate': 0.0, 'resources_per_second': 500.0}]
+        self.assertEqual(len(compare(current, baseline, tolerance=0.2)), 1)
+
+
+    def test_failed_case_does_not_hang(self):
+        """Test that a case whose process fails is reported instead of waited on forever."""
+        with self.assertRaises(RuntimeError) as raised:
+            run_isolated(10, 0.0, 0.0, '/nonexistent/recording.json', 0, poll_interval=0.1)
+        self.assertIn('FileNotFoundError', str(raised.exception))
+
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['--sizes', '10', '--recording', '/nonexistent/recording.json']), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.checkpoint import LocalCheckpoint
+from src.policy.engine import load_policy
+from src.validators.aws_validator import AWSValidator
+from tests.helpers import StubValidator
+
+
+class CountingCheckpoint(LocalCheckpoint):
+    """Local checkpoint that counts batch writes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writes = 0
+
+    def _write_batch(self, lines):
+        self.writes += 1
+        super()._write_batch(lines)
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test cases for checkpointing and resumable scans."""
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'journal.ndjson')
+        self.buckets = [f"bucket-{i}" for i in range(10)]
+
+    def test_writes_are_batched(self):
+        """Test that the journal is written once per batch, not per resource."""
+        checkpoint = CountingCheckpoint(self.path, flush_every=4)
+        StubValidator().validate_all(self.buckets, [], checkpoint=checkpoint)
+
+        # Two full batches plus the final flush
+        self.assertEqual(checkpoint.writes, 3)
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 10)
+
+    def test_resume_skips_completed_resources(self):
+        """Test that a crashed scan resumes where its last checkpoint left off."""
+        with self.assertRaises(KeyboardInterrupt):
+            StubValidator(fail_after=6).validate_all(
+                self.buckets, [], checkpoint=LocalCheckpoint(self.path, flush_every=100)
+            )
+
+        validator = StubValidator()
+        result = validator.validate_all(
+            self.buckets, [], checkpoint=LocalCheckpoint(self.path, resume=True)
+        )
+
+        self.assertEqual(validator.calls, self.buckets[6:])
+        self.assertEqual([loc.id for loc in result.storage_locations], self.buckets)
+        self.assertTrue(result.all_encrypted)
+
+    def test_without_resume_journal_is_discarded(self):
+        """Test that a fresh run ignores and replaces an old journal."""
+        StubValidator().validate_all(self.buckets, [], checkpoint=LocalCheckpoint(self.path))
+
+        validator = StubValidator()
+        validator.validate_all(self.buckets[:2], [], checkpoint=LocalCheckpoint(self.path))
+
+        self.assertEqual(validator.calls, self.buckets[:2])
+        self.assertEqual(len(LocalCheckpoint(self.path, resume=True).completed()), 2)
+
+    def test_torn_final_line_is_ignored(self):
+        """Test that a partially written record does not break resuming."""
+        StubValidator().validate_all(self.buckets[:3], [], checkpoint=LocalCheckpoint(self.path))
+        with open(self.path, 'a') as f:
+            f.write('{"key": "object_storage:bucket-3", "loc')
+
+        self.assertEqual(len(LocalCheckpoint(self.path, resume=True).completed()), 3)
+
+    def test_append_after_torn_line_starts_new_record(self):
+        """Test that records written after a torn line survive the next resume."""
+        StubValidator().validate_all(self.buckets[:3], [], checkpoint=LocalCheckpoint(self.path))
+        with open(self.path, 'a') as f:
+            f.write('{"key": "object_storage:bucket-3", "loc')
+
+        StubValidator().validate_all(self.buckets, [], checkpoint=LocalCheckpoint(self.path, resume=True))
+
+        completed = LocalCheckpoint(self.path, resume=True).completed()
+        self.assertEqual(len(completed), len(self.buckets))
+
+    def test_deadline_stops_scan_for_later_resume(self):
+        """Test that a scan stops at its deadline and reports the remainder."""
+        result = StubValidator().validate_all(
+            self.buckets, [], checkpoint=LocalCheckpoint(self.path), deadline=time.time() - 1
+        )
+
+        self.assertEqual(result.storage_locations, [])
+        self.assertEqual(result.not_validated, len(self.buckets))
+        self.assertFalse(result.all_encrypted)
+
+    def test_failing_resource_named_scan_is_not_a_deadline_stop(self):
+        """Test that a real resource called 'scan' does not mark the run incomplete."""
+        result = StubValidator(failing=['scan']).validate_all(['scan'], [])
+
+        self.assertEqual(result.errors[0]['resource_id'], 'scan')
+        self.assertEqual(result.not_validated, 0)
+
+    def test_restored_locations_use_current_policy(self):
+        """Test that resuming under another policy re-evaluates journaled locations."""
+        details = {'status': 'encrypted', 'type': 'server_side', 'key_manager': 'AWS', 'fips_endpoint': True}
+        interrupted = AWSValidator(region_name='us-east-1')
+        interrupted.aws = MagicMock()
+        interrupted.aws.get_s3_bucket_encryption.side_effect = [dict(details)] * 3 + [KeyboardInterrupt()]
+        with self.assertRaises(KeyboardInterrupt):
+            interrupted.validate_all(self.buckets, [], checkpoint=LocalCheckpoint(self.path, flush_every=1))
+
+        resumed = AWSValidator(region_name='us-east-1', policy=load_policy('fedramp-high'))
+        resumed.aws = MagicMock()
+        resumed.aws.get_s3_bucket_encryption.side_effect = lambda bucket: dict(details)
+        result = resumed.validate_all(self.buckets, [], checkpoint=LocalCheckpoint(self.path, resume=True))
+
+        self.assertEqual(resumed.aws.get_s3_bucket_encryption.call_count, len(self.buckets) - 3)
+        self.assertEqual([loc.compliant for loc in result.storage_locations], [False] * len(self.buckets))
+
+
+if __name__ == "__main__":
+    unittest.main()
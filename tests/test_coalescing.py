@@ -0,0 +1,123 @@
+import threading
+import time
+import unittest
+
+from botocore.exceptions import ClientError
+
+from src.events import RESOURCE_STARTED, SCAN_STARTED
+from src.models import ResourceType
+from src.providers.aws import AWSProvider
+from tests.helpers import StubValidator
+
+
+class BlockingS3Client:
+    """S3 client stub that holds every call until released."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+        self.release = threading.Event()
+        self.meta = None
+
+    def get_bucket_encryption(self, Bucket):
+        self.calls.append(Bucket)
+        self.release.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return {
+            'ServerSideEncryptionConfiguration': {
+                'Rules': [{'ApplyServerSideEncryptionByDefault': {'SSEAlgorithm': 'AES256'}}]
+            }
+        }
+
+
+class TestCoalescing(unittest.TestCase):
+    """Test cases for request coalescing and duplicate resource handling."""
+
+    def _provider(self, client):
+        provider = AWSProvider(region_name='us-east-1')
+        provider._clients['s3'] = client
+        return provider
+
+    def _call_concurrently(self, provider, bucket_names):
+        results, errors = [], []
+
+        def worker(bucket_name):
+            try:
+                results.append(provider.get_s3_bucket_encryption(bucket_name))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in bucket_names]
+        for thread in threads:
+            thread.start()
+        # Let every thread reach the client or the in-flight wait
+        while len(provider._in_flight) < len(set(bucket_names)):
+            time.sleep(0.001)
+        time.sleep(0.05)
+        provider._clients['s3'].release.set()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_requests_are_coalesced(self):
+        """Test that identical in-flight requests make a single API call."""
+        client = BlockingS3Client()
+        provider = self._provider(client)
+
+        results, errors = self._call_concurrently(provider, ['bucket-1'] * 5 + ['bucket-2'])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(client.calls), ['bucket-1', 'bucket-2'])
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result['algorithm'] == 'AES256' for result in results))
+        # Callers get independent copies
+        results[0]['status'] = 'changed'
+        self.assertEqual(results[1]['status'], 'encrypted')
+        self.assertEqual(provider._in_flight, {})
+
+    def test_errors_are_shared(self):
+        """Test that waiters receive the in-flight call's exception."""
+        error = ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'denied'}}, 'GetBucketEncryption')
+        client = BlockingS3Client(error=error)
+        provider = self._provider(client)
+
+        results, errors = self._call_concurrently(provider, ['bucket-1'] * 3)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(client.calls, ['bucket-1'])
+
+    def test_sequential_requests_are_not_cached(self):
+        """Test that completed requests are made again on the next call."""
+        client = BlockingS3Client()
+        client.release.set()
+        provider = self._provider(client)
+
+        provider.get_s3_bucket_encryption('bucket-1')
+        provider.get_s3_bucket_encryption('bucket-1')
+
+        self.assertEqual(client.calls, ['bucket-1', 'bucket-1'])
+
+    def test_validate_all_deduplicates_input(self):
+        """Test that duplicates are validated once but kept in the output."""
+        validator = StubValidator()
+        events = []
+        validator.events.subscribe(events.append)
+
+        result = validator.validate_all(['bucket-1', 'broken', 'bucket-1', 'broken'], ['bucket-1'])
+
+        self.assertEqual(validator.calls, ['bucket-1', 'broken', 'bucket-1'])
+        self.assertEqual([(loc.id, loc.type) for loc in result.storage_locations], [
+            ('bucket-1', ResourceType.OBJECT_STORAGE),
+            ('bucket-1', ResourceType.OBJECT_STORAGE),
+            ('bucket-1', ResourceType.DATABASE),
+        ])
+        self.assertEqual([error['resource_id'] for error in result.errors], ['broken', 'broken'])
+        self.assertEqual(events[0].kind, SCAN_STARTED)
+        self.assertEqual(events[0].total, 3)
+        self.assertEqual(sum(1 for event in events if event.kind == RESOURCE_STARTED), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+
+from src.distributed.coordinator import coordinate, make_shards, process_shard, reduce_results, run_worker
+from src.distributed.queue import SQLiteShardQueue
+from src.distributed.store import LocalResultStore
+from tests.helpers import StubValidator
+
+
+class TestDistributedScan(unittest.TestCase):
+    """Test cases for sharded scanning."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.queue = SQLiteShardQueue(os.path.join(self.tmp, 'queue.db'))
+        self.store = LocalResultStore(os.path.join(self.tmp, 'results'))
+        self.buckets = [f"bucket-{i}" for i in range(7)]
+        self.databases = ['table-1', 'db-1']
+        self.types = {'table-1': 'dynamodb', 'db-1': 'rds'}
+
+    def test_make_shards_covers_every_resource(self):
+        """Test that shards cover each resource exactly once."""
+        shards = make_shards('run-1', self.buckets, self.databases, self.types, shard_size=4)
+
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(sum((s.object_storage_ids for s in shards), []), self.buckets)
+        self.assertEqual(sum((s.database_ids for s in shards), []), self.databases)
+        self.assertEqual(len({s.shard_id for s in shards}), 3)
+
+    def test_workers_and_reducer_produce_single_result(self):
+        """Test a full coordinate, work and reduce cycle with two workers."""
+        coordinate(self.queue, self.store, self.buckets, self.databases, self.types, shard_size=3)
+
+        first, second = StubValidator(), StubValidator()
+        self.assertEqual(run_worker(first, self.queue, self.store, max_shards=1), 1)
+        run_worker(second, self.queue, self.store)
+        self.assertEqual(len(self.queue), 0)
+
+        result = reduce_results(self.store)
+
+        self.assertEqual([loc.id for loc in result.storage_locations], self.buckets + self.databases)
+        self.assertEqual(result.storage_locations[-1].encryption_details, {'db_type': 'rds'})
+        self.assertTrue(result.all_encrypted)
+
+    def test_duplicate_and_redelivered_shards_are_idempotent(self):
+        """Test that duplicate submissions and redeliveries are not rescanned."""
+        coordinate(self.queue, self.store, self.buckets, [], {}, shard_size=10, run_id='run-1')
+        coordinate(self.queue, self.store, self.buckets, [], {}, shard_size=10, run_id='run-1')
+        self.assertEqual(len(self.queue), 1)
+
+        # A worker that stores its result but crashes before acking leaves
+        # the shard to be redelivered
+        message = self.queue.receive(visibility_timeout=0)
+        validator = StubValidator()
+        process_shard(validator, message.shard, self.store)
+        self.assertEqual(len(validator.calls), len(self.buckets))
+        self.assertEqual(len(self.queue), 1)
+
+        # The redelivery is acked without rescanning
+        redelivered = StubValidator()
+        self.assertEqual(run_worker(redelivered, self.queue, self.store), 0)
+        self.assertEqual(redelivered.calls, [])
+        self.assertEqual(len(self.queue), 0)
+
+        # So is a duplicate delivered after the shard was acked
+        self.queue.put(message.shard)
+        self.assertEqual(run_worker(redelivered, self.queue, self.store), 0)
+        self.assertEqual(redelivered.calls, [])
+        self.assertEqual(len(self.queue), 0)
+
+        result = reduce_results(self.store)
+        self.assertEqual(len(result.storage_locations), len(self.buckets))
+
+    def test_repeat_scans_are_validated_again(self):
+        """Test that a second scan into the same store rescans every resource."""
+        first_scan = coordinate(self.queue, self.store, ['b1', 'b2'], [], {})
+        first = StubValidator()
+        self.assertEqual(run_worker(first, self.queue, self.store), 1)
+
+        second_scan = coordinate(self.queue, self.store, ['b1', 'b2'], [], {})
+        second = StubValidator()
+        self.assertEqual(run_worker(second, self.queue, self.store), 1)
+
+        self.assertEqual(first.calls, ['b1', 'b2'])
+        self.assertEqual(second.calls, ['b1', 'b2'])
+        first_run, second_run = first_scan[0].run_id, second_scan[0].run_id
+        self.assertNotEqual(first_run, second_run)
+        self.assertNotEqual(first_scan[0].shard_id, second_scan[0].shard_id)
+        self.assertEqual(self.store.latest_run(), second_run)
+        self.assertEqual(self.store.get_manifest(first_run), [first_scan[0].shard_id])
+
+        # Reduce the latest run by default, or an earlier one by ID
+        self.assertEqual(len(reduce_results(self.store).storage_locations), 2)
+        self.assertEqual(len(reduce_results(self.store, first_run).storage_locations), 2)
+
+    def test_reduce_without_runs_fails(self):
+        """Test that reducing an empty store is an error rather than an empty report."""
+        with self.assertRaises(ValueError):
+            reduce_results(self.store)
+
+    def test_missing_shards_are_reported(self):
+        """Test that an incomplete scan is not reported as compliant."""
+        coordinate(self.queue, self.store, self.buckets, [], {}, shard_size=4)
+        run_worker(StubValidator(), self.queue, self.store, max_shards=1)
+
+        result = reduce_results(self.store)
+
+        self.assertFalse(result.all_encrypted)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0]['resource_id'].startswith('shard:'))
+
+    def test_errors_are_carried_into_result(self):
+        """Test that per-resource errors from workers are merged."""
+        coordinate(self.queue, self.store, ['broken'] + self.buckets, [], {}, shard_size=4)
+        run_worker(StubValidator(), self.queue, self.store)
+
+        result = reduce_results(self.store)
+
+        self.assertEqual(result.errors[0]['resource_id'], 'broken')
+        self.assertFalse(result.all_encrypted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import unittest
+
+from rich.console import Console
+
+from src.checkpoint import LocalCheckpoint
+from src.events import (
+    EventBus, RESOURCE_COMPLETED, RESOURCE_FAILED, RESOURCE_STARTED, SCAN_FINISHED, SCAN_STARTED
+)
+from src.progress import LiveProgress, ProgressTracker
+from tests.helpers import StubValidator
+
+
+class TestEvents(unittest.TestCase):
+    """Test cases for validation events and progress tracking."""
+
+    def test_validate_all_emits_events(self):
+        """Test the event sequence emitted during validation."""
+        validator = StubValidator()
+        events = []
+        unsubscribe = validator.events.subscribe(events.append)
+
+        validator.validate_all(['bucket-1', 'broken'], ['table-1'])
+
+        self.assertEqual([event.kind for event in events], [
+            SCAN_STARTED,
+            RESOURCE_STARTED, RESOURCE_COMPLETED,
+            RESOURCE_STARTED, RESOURCE_FAILED,
+            RESOURCE_STARTED, RESOURCE_COMPLETED,
+            SCAN_FINISHED
+        ])
+        self.assertEqual(events[0].total, 3)
+        self.assertEqual(events[4].error, "Access denied")
+        self.assertEqual(events[6].service, 'database')
+
+        unsubscribe()
+        self.assertFalse(validator.events.active)
+        validator.validate_all(['bucket-2'], [])
+        self.assertEqual(len(events), 8)
+
+    def test_failing_subscriber_does_not_abort_scan(self):
+        """Test that a raising callback is logged and the scan carries on."""
+        validator = StubValidator()
+        events = []
+
+        def faulty(event):
+            if event.kind == RESOURCE_COMPLETED:
+                raise RuntimeError("integration bug")
+
+        validator.events.subscribe(faulty)
+        validator.events.subscribe(events.append)
+        path = os.path.join(tempfile.mkdtemp(), 'journal.ndjson')
+
+        with self.assertLogs('src.events', level='ERROR') as logs:
+            result = validator.validate_all(['bucket-1', 'bucket-2'], ['table-1'],
+                                            checkpoint=LocalCheckpoint(path))
+
+        self.assertEqual(len(logs.records), 3)
+        self.assertEqual(len(result.storage_locations), 3)
+        self.assertEqual(sum(1 for event in events if event.kind == RESOURCE_COMPLETED), 3)
+        self.assertEqual(events[-1].kind, SCAN_FINISHED)
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+    def test_tracker_snapshot(self):
+        """Test that the tracker derives progress figures from events."""
+        validator = StubValidator()
+        tracker = ProgressTracker()
+        validator.events.subscribe(tracker)
+
+        validator.validate_all(['bucket-1', 'broken'], ['table-1'])
+        stats = tracker.snapshot()
+
+        self.assertEqual((stats['done'], stats['total']), (3, 3))
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['services'], {
+            'object_storage': {'done': 2, 'errors': 1},
+            'database': {'done': 1, 'errors': 0},
+        })
+
+    def test_emit_from_threads(self):
+        """Test that events from several threads are all counted."""
+        bus = EventBus()
+        tracker = ProgressTracker()
+        bus.subscribe(tracker)
+
+        def worker():
+            for _ in range(500):
+                bus.emit(RESOURCE_STARTED, service='s3')
+                bus.emit(RESOURCE_COMPLETED, service='s3')
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(tracker.completed, 2000)
+        self.assertEqual(tracker.snapshot()['in_flight'], 0)
+
+    def test_async_queue_subscription(self):
+        """Test forwarding events from a worker thread to an asyncio queue."""
+        async def scan():
+            validator = StubValidator()
+            queue = asyncio.Queue()
+            validator.events.subscribe_queue(queue)
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: validator.validate_all(['bucket-1'], [])
+            )
+            kinds = []
+            while len(kinds) < 4:
+                kinds.append((await asyncio.wait_for(queue.get(), timeout=5)).kind)
+            return kinds
+
+        self.assertEqual(asyncio.run(scan()),
+                         [SCAN_STARTED, RESOURCE_STARTED, RESOURCE_COMPLETED, SCAN_FINISHED])
+
+    def test_live_progress_renders(self):
+        """Test that the live display renders and unsubscribes on exit."""
+        validator = StubValidator()
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=100)
+
+        with LiveProgress(validator.events, console):
+            validator.validate_all(['bucket-1', 'broken'], [])
+
+        self.assertIn('2/2', output.getvalue())
+        self.assertFalse(validator.events.active)
+
+
+if __name__ == "__main__":
+    unittest.main()
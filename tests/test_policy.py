@@ -0,0 +1,168 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.models import EncryptionType, ResourceType, StorageLocation, ValidationResult
+from src.policy.engine import Policy, PolicyError, classify_encryption, load_policy
+from src.validators.aws_validator import AWSValidator
+
+
+SSE = {'status': 'encrypted', 'type': 'server_side', 'key_manager': 'AWS', 'fips_endpoint': True}
+CMK = {'status': 'encrypted', 'type': 'customer_managed_key', 'key_manager': 'CUSTOMER',
+       'key_id': 'arn:aws-us-gov:kms:us-gov-west-1:123456789012:key/abcd1234', 'fips_endpoint': True}
+# The default aws/rds key sets KmsKeyId, but is managed by AWS
+AWS_MANAGED_KMS = dict(CMK, key_manager='AWS')
+UNENCRYPTED = {'status': 'unencrypted', 'fips_endpoint': True}
+
+
+class TestPolicy(unittest.TestCase):
+    """Test cases for the declarative policy engine."""
+
+    def test_default_policy_matches_original_rules(self):
+        """Test that the default policy treats SSE and CMK as compliant."""
+        policy = load_policy()
+
+        self.assertTrue(policy.evaluate('object_storage', 'aws', 'us-east-1', SSE))
+        self.assertTrue(policy.evaluate('database', 'aws', 'us-east-1', CMK))
+        self.assertFalse(policy.evaluate('object_storage', 'aws', 'us-east-1', UNENCRYPTED))
+        self.assertFalse(policy.evaluate('object_storage', 'aws', 'us-east-1', {'status': 'unknown'}))
+
+    def test_high_requires_cmk_and_fips(self):
+        """Test that FedRAMP High rejects AWS managed keys and non-FIPS endpoints."""
+        high = load_policy('fedramp-high')
+        moderate = load_policy('fedramp-moderate')
+
+        self.assertFalse(high.evaluate('object_storage', 'aws', None, SSE))
+        self.assertTrue(moderate.evaluate('object_storage', 'aws', None, SSE))
+        self.assertTrue(high.evaluate('database', 'aws', None, CMK))
+        self.assertFalse(high.evaluate('database', 'aws', None, AWS_MANAGED_KMS))
+        self.assertTrue(moderate.evaluate('database', 'aws', None, AWS_MANAGED_KMS))
+        # A key KMS could not describe is not trusted as customer managed
+        undescribed_key = dict(CMK, key_manager=None)
+        self.assertTrue(load_policy().evaluate('database', 'aws', None, undescribed_key))
+        self.assertFalse(high.evaluate('database', 'aws', None, undescribed_key))
+        self.assertFalse(moderate.evaluate('database', 'aws', None, undescribed_key))
+        self.assertFalse(high.evaluate('database', 'aws', None, dict(CMK, fips_endpoint=False)))
+        self.assertEqual(
+            high.failed_rules('object_storage', 'aws', None, dict(SSE, fips_endpoint=False)),
+            ['customer-managed-key', 'fips-endpoint']
+        )
+
+    def test_moderate_differs_from_default(self):
+        """Test that FedRAMP Moderate requires a known key manager and FIPS endpoints."""
+        default = load_policy()
+        moderate = load_policy('fedramp-moderate')
+        unverified_key = dict(SSE, key_manager=None)
+        no_fips = dict(SSE, fips_endpoint=False)
+
+        self.assertTrue(default.evaluate('object_storage', 'aws', None, unverified_key))
+        self.assertFalse(moderate.evaluate('object_storage', 'aws', None, unverified_key))
+        self.assertTrue(default.evaluate('object_storage', 'aws', None, no_fips))
+        self.assertEqual(moderate.failed_rules('object_storage', 'aws', None, no_fips), ['fips-endpoint'])
+
+    def test_rules_can_be_scoped_and_loaded_from_file(self):
+        """Test applies_to selectors and loading a policy from YAML."""
+        path = os.path.join(tempfile.mkdtemp(), 'policy.yaml')
+        with open(path, 'w') as f:
+            f.write(
+                "name: databases-need-cmk\n"
+                "rules:\n"
+                "  - id: encrypted\n"
+                "    require: {status: encrypted}\n"
+                "  - id: database-cmk\n"
+                "    applies_to: {resource_type: database}\n"
+                "    require:\n"
+                "      key_id: {prefix: 'arn:aws-us-gov:'}\n"
+            )
+        policy = load_policy(path)
+
+        self.assertEqual(policy.name, 'databases-need-cmk')
+        self.assertTrue(policy.evaluate('object_storage', 'aws', None, SSE))
+        self.assertFalse(policy.evaluate('database', 'aws', None, SSE))
+        self.assertTrue(policy.evaluate('database', 'aws', None, CMK))
+
+    def test_exists_only_fields_share_memo_entries(self):
+        """Test that distinct key IDs tested only with exists are memoized once."""
+        high = Policy.from_dict({
+            'rules': [{'require': {'key_manager': 'CUSTOMER', 'key_id': {'exists': True}}}]
+        })
+        key_ids = [f"{CMK['key_id']}-{index}" for index in range(50)] + [None]
+        locations = [
+            StorageLocation(
+                id=f"resource-{index}",
+                name=f"resource-{index}",
+                type=ResourceType.DATABASE,
+                provider='aws',
+                encryption_type=EncryptionType.CUSTOMER_MANAGED_KEY,
+                encryption_details=dict(CMK, key_id=key_id),
+                compliant=True
+            )
+            for index, key_id in enumerate(key_ids)
+        ]
+
+        self.assertEqual(high.evaluate_locations(locations), [True] * 50 + [False])
+        self.assertEqual(len(high._cache), 2)
+        self.assertFalse(high.evaluate('database', 'aws', None, dict(CMK, key_id=None)))
+        self.assertEqual(high.evaluate_columns({'key_manager': ['CUSTOMER'], 'key_id': ['k']}), [True])
+
+        # A field also tested by value keeps its value
+        scoped = Policy.from_dict({'rules': [
+            {'require': {'key_id': {'exists': True}}},
+            {'require': {'key_id': {'prefix': 'arn:aws-us-gov:'}}},
+        ]})
+        self.assertFalse(scoped.evaluate('database', 'aws', None, dict(CMK, key_id='arn:aws:kms:key')))
+
+    def test_invalid_policies_are_rejected(self):
+        """Test that malformed policies raise PolicyError."""
+        with self.assertRaises(PolicyError):
+            Policy.from_dict({'rules': [{'require': {'status': {'matches': 'enc.*'}}}]})
+        with self.assertRaises(PolicyError):
+            Policy.from_dict({'name': 'no-rules'})
+        with self.assertRaises(PolicyError):
+            load_policy('no-such-policy')
+
+    def test_columnar_and_cached_result_evaluation(self):
+        """Test bulk evaluation and re-evaluating a cached result."""
+        high = load_policy('fedramp-high')
+        columns = {
+            'status': ['encrypted', 'encrypted', 'unencrypted'],
+            'type': ['server_side', 'customer_managed_key', None],
+            'key_id': [None, CMK['key_id'], None],
+            'key_manager': ['AWS', 'CUSTOMER', None],
+            'fips_endpoint': [True, True, True],
+        }
+        self.assertEqual(high.evaluate_columns(columns), [False, True, False])
+
+        result = ValidationResult()
+        for index, details in enumerate([SSE, CMK]):
+            result.add_location(StorageLocation(
+                id=f"resource-{index}",
+                name=f"resource-{index}",
+                type=ResourceType.OBJECT_STORAGE,
+                provider='aws',
+                encryption_type=classify_encryption(details),
+                encryption_details=details,
+                compliant=True
+            ))
+        self.assertTrue(result.all_encrypted)
+
+        high.apply(result)
+
+        self.assertEqual([loc.compliant for loc in result.storage_locations], [False, True])
+        self.assertFalse(result.all_encrypted)
+
+    def test_validator_uses_policy(self):
+        """Test that the AWS validator evaluates compliance with its policy."""
+        validator = AWSValidator(region_name='us-east-1', policy=load_policy('fedramp-high'))
+        validator.aws = MagicMock()
+        validator.aws.get_s3_bucket_encryption.return_value = dict(SSE)
+
+        location = validator.validate_object_storage('test-bucket')
+
+        self.assertEqual(location.encryption_type, EncryptionType.SERVER_SIDE)
+        self.assertFalse(location.compliant)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from src.profiling import Tracer, get_tracer, profiling_enabled, set_tracer, span, traced
+from tests.helpers import StubValidator
+
+
+class Traced:
+    """Object with a traced method."""
+
+    @traced('example.lookup', 'test')
+    def lookup(self, resource_id):
+        return resource_id.upper()
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for the tracer and its instrumentation."""
+
+    def tearDown(self):
+        set_tracer(None)
+
+    def test_spans_are_nested(self):
+        """Test that nested spans are recorded inside their parent."""
+        tracer = Tracer()
+        with tracer.span('outer', 'test', resource='a'):
+            with tracer.span('inner', 'test'):
+                pass
+
+        inner, outer = tracer.events
+        self.assertEqual((inner['name'], outer['name']), ('inner', 'outer'))
+        self.assertEqual(outer['ph'], 'X')
+        self.assertEqual(outer['args'], {'resource': 'a'})
+        self.assertGreaterEqual(inner['ts'], outer['ts'])
+        self.assertLessEqual(inner['ts'] + inner['dur'], outer['ts'] + outer['dur'])
+
+    def test_span_records_errors(self):
+        """Test that a span closed by an exception is marked with the error."""
+        tracer = Tracer()
+        with self.assertRaises(KeyError):
+            with tracer.span('failing', 'test'):
+                raise KeyError('missing')
+
+        self.assertEqual(tracer.events[0]['args'], {'error': 'KeyError'})
+
+    def test_sampling_applies_to_whole_resource(self):
+        """Test that unsampled resources suppress their children."""
+        tracer = Tracer(sample_rate=0.0)
+        for _ in range(10):
+            with tracer.resource_span('validate.root', 'test'):
+                with tracer.span('child', 'test'):
+                    pass
+        self.assertEqual(tracer.events, [])
+
+        tracer = Tracer(sample_rate=0.5, seed=7)
+        for _ in range(200):
+            with tracer.resource_span('validate.root', 'test'):
+                with tracer.span('child', 'test'):
+                    pass
+        counts = {spot['name']: spot['count'] for spot in tracer.hot_spots()}
+        self.assertEqual(counts['validate.root'], counts['child'])
+        self.assertTrue(0 < counts['validate.root'] < 200)
+
+    def test_setup_and_report_spans_are_always_recorded(self):
+        """Test that sampling does not drop one-off spans outside resources."""
+        tracer = Tracer(sample_rate=0.0)
+        with tracer.span('report.write_json', 'report'):
+            pass
+        with tracer.resource_span('validate.object_storage', 'validate'):
+            with tracer.span('aws.create_client', 'aws', always=True):
+                pass
+            with tracer.span('aws.s3.get_bucket_encryption', 'aws'):
+                pass
+
+        self.assertEqual([event['name'] for event in tracer.events],
+                         ['report.write_json', 'aws.create_client'])
+
+    def test_profiling_enabled_restores_previous_tracer(self):
+        """Test that the context manager only enables the tracer inside it."""
+        outer, inner = Tracer(), Tracer()
+        set_tracer(outer)
+
+        with profiling_enabled(inner):
+            self.assertIs(get_tracer(), inner)
+        self.assertIs(get_tracer(), outer)
+
+        with profiling_enabled(None):
+            self.assertIsNone(get_tracer())
+        self.assertIs(get_tracer(), outer)
+
+    def test_max_events_bounds_memory(self):
+        """Test that spans beyond the cap are counted as dropped."""
+        tracer = Tracer(max_events=5)
+        for _ in range(8):
+            with tracer.span('op', 'test'):
+                pass
+
+        self.assertEqual(len(tracer.events), 5)
+        self.assertEqual(tracer.dropped, 3)
+        self.assertIn('3 spans dropped', tracer.format_hot_spots())
+
+    def test_spans_from_threads(self):
+        """Test that spans from concurrent threads are all recorded."""
+        tracer = Tracer()
+
+        def worker():
+            for _ in range(100):
+                with tracer.span('root', 'test'):
+                    with tracer.span('child', 'test'):
+                        pass
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(tracer.events), 800)
+
+    def test_disabled_is_no_op(self):
+        """Test that module-level helpers do nothing without a tracer."""
+        self.assertIsNone(get_tracer())
+        with span('anything', 'test'):
+            pass
+        self.assertEqual(Traced().lookup('abc'), 'ABC')
+
+    def test_traced_records_resource(self):
+        """Test that the decorator records the resource argument."""
+        tracer = Tracer()
+        set_tracer(tracer)
+
+        self.assertEqual(Traced().lookup('abc'), 'ABC')
+
+        self.assertEqual(tracer.events[0]['name'], 'example.lookup')
+        self.assertEqual(tracer.events[0]['args'], {'resource': 'abc'})
+
+    def test_validate_all_is_traced(self):
+        """Test that validation produces per-resource spans and hot spots."""
+        tracer = Tracer()
+        set_tracer(tracer)
+
+        StubValidator().validate_all(['bucket-1', 'bucket-2'], ['table-1'])
+
+        spots = {spot['name']: spot for spot in tracer.hot_spots()}
+        self.assertEqual(spots['validate.object_storage']['count'], 2)
+        self.assertEqual(spots['validate.database']['count'], 1)
+        self.assertEqual(spots['aws.s3.get_bucket_encryption']['count'], 2)
+
+    def test_write_chrome_trace(self):
+        """Test the Chrome trace file structure."""
+        tracer = Tracer(sample_rate=0.5, seed=1)
+        for _ in range(20):
+            with tracer.span('op', 'test'):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tracer.write_chrome_trace(os.path.join(tmp, 'trace.json'))
+            with open(path) as f:
+                trace = json.load(f)
+
+        self.assertEqual(trace['displayTimeUnit'], 'ms')
+        self.assertEqual(len(trace['traceEvents']), len(tracer.events))
+        self.assertEqual(trace['otherData']['sample_rate'], 0.5)
+        self.assertEqual(trace['otherData']['hot_spots'][0]['name'], 'op')
+
+
+if __name__ == "__main__":
+    unittest.main()
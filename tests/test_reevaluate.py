@@ -0,0 +1,147 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from src.checkpoint import LocalCheckpoint, checkpoint_key
+from src.distributed.store import LocalResultStore
+from src.main import cli
+from src.models import EncryptionType, ResourceType, StorageLocation, ValidationResult
+from src.policy.engine import load_policy
+from src.reevaluate import load_result, reevaluate
+from src.report.generator import ReportGenerator
+
+
+def make_result():
+    """Build a result as the default policy would have produced it."""
+    result = ValidationResult()
+    details = [
+        {'status': 'encrypted', 'type': 'server_side', 'algorithm': 'AES256', 'key_manager': 'AWS',
+         'fips_endpoint': True},
+        {'status': 'encrypted', 'type': 'customer_managed_key', 'key_id': 'arn:key/1', 'key_manager': 'CUSTOMER',
+         'fips_endpoint': True},
+        {'status': 'unencrypted', 'fips_endpoint': True},
+    ]
+    for index, encryption_details in enumerate(details):
+        result.add_location(StorageLocation(
+            id=f"resource-{index}",
+            name=f"resource-{index}",
+            type=ResourceType.OBJECT_STORAGE,
+            provider="aws",
+            region="us-east-1",
+            encryption_type=EncryptionType.UNKNOWN,
+            encryption_details=encryption_details,
+            compliant=index < 2
+        ))
+    return result
+
+
+class TestReevaluate(unittest.TestCase):
+    """Test cases for offline re-evaluation of stored results."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def assert_high_outcome(self, result):
+        self.assertEqual([loc.compliant for loc in result.storage_locations], [False, True, False])
+        self.assertEqual(
+            [loc.encryption_type for loc in result.storage_locations],
+            [EncryptionType.SERVER_SIDE, EncryptionType.CUSTOMER_MANAGED_KEY, EncryptionType.NONE]
+        )
+        self.assertFalse(result.all_encrypted)
+
+    def test_reevaluate_json_report(self):
+        """Test re-evaluating a JSON report against a stricter policy."""
+        path = ReportGenerator(output_dir=self.tmp).generate_json(make_result(), 'report.json')
+
+        result = reevaluate(load_result(path), load_policy('fedramp-high'), processes=1)
+
+        self.assert_high_outcome(result)
+
+    def test_reevaluate_ndjson_and_checkpoint_journal(self):
+        """Test loading plain NDJSON locations and checkpoint journals."""
+        locations_path = os.path.join(self.tmp, 'locations.ndjson')
+        with open(locations_path, 'w') as f:
+            for location in make_result().storage_locations:
+                f.write(location.model_dump_json() + '\n')
+
+        journal_path = os.path.join(self.tmp, 'journal.ndjson')
+        checkpoint = LocalCheckpoint(journal_path)
+        for location in make_result().storage_locations:
+            checkpoint.record(checkpoint_key(location.type.value, location.id), location)
+        checkpoint.flush()
+
+        for path in (locations_path, journal_path):
+            result = reevaluate(load_result(path), load_policy('fedramp-high'), processes=1)
+            self.assert_high_outcome(result)
+
+    def test_reevaluate_result_store(self):
+        """Test loading distributed partial results."""
+        store = LocalResultStore(os.path.join(self.tmp, 'partials'))
+        store.put_manifest('run-1', ['a'])
+        store.put_result('run-1', 'a', make_result())
+
+        result = reevaluate(load_result(store.directory.as_posix()), load_policy('fedramp-high'), processes=1)
+
+        self.assert_high_outcome(result)
+
+    def test_parallel_evaluation_matches_serial(self):
+        """Test that evaluation across processes gives the same outcome."""
+        result = ValidationResult()
+        for index in range(40):
+            result.add_location(StorageLocation(
+                id=f"db-{index}",
+                name=f"db-{index}",
+                type=ResourceType.DATABASE,
+                provider="aws",
+                encryption_details={
+                    'status': 'encrypted',
+                    'type': 'customer_managed_key',
+                    'key_id': f"arn:key/{index}" if index % 3 else None,
+                    'key_manager': 'CUSTOMER',
+                    'fips_endpoint': True
+                }
+            ))
+
+        with patch('src.reevaluate.PARALLEL_THRESHOLD', 1), patch('src.reevaluate.CHUNK_SIZE', 7):
+            reevaluate(result, load_policy('fedramp-high'), processes=2)
+
+        self.assertEqual(
+            [loc.compliant for loc in result.storage_locations],
+            [bool(index % 3) for index in range(40)]
+        )
+
+    def test_cli_writes_reports(self):
+        """Test the reevaluate command end to end."""
+        path = ReportGenerator(output_dir=self.tmp).generate_json(make_result(), 'report.json')
+        output_dir = os.path.join(self.tmp, 'out')
+
+        outcome = CliRunner().invoke(cli, [
+            'reevaluate', path, '--policy', 'fedramp-high', '--format', 'json',
+            '--output-dir', output_dir, '--workers', '1'
+        ])
+
+        self.assertEqual(outcome.exit_code, 0, outcome.output)
+        reports = [name for name in os.listdir(output_dir) if name.endswith('.json')]
+        with open(os.path.join(output_dir, reports[0])) as f:
+            self.assertFalse(json.load(f)['all_encrypted'])
+
+    def test_cli_reports_unreadable_source(self):
+        """Test that a missing or invalid source is reported without a traceback."""
+        invalid = os.path.join(self.tmp, 'invalid.json')
+        with open(invalid, 'w') as f:
+            f.write('{not json')
+
+        for source in (os.path.join(self.tmp, 'missing.json'), invalid):
+            outcome = CliRunner().invoke(cli, ['reevaluate', source])
+
+            self.assertEqual(outcome.exit_code, 0)
+            self.assertIsNone(outcome.exception)
+            self.assertIn('Error:', outcome.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
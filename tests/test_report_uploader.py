@@ -0,0 +1,121 @@
+import json
+import threading
+import unittest
+
+from src.models import EncryptionType, ResourceType, StorageLocation, ValidationResult
+from src.report.generator import ReportGenerator
+from src.report.uploader import S3ReportUploader
+
+
+class LocalS3:
+    """Minimal in-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        data = fileobj.read()
+        with self._lock:
+            self.objects[(bucket, key)] = data
+            self.calls.append({'key': key, 'extra_args': ExtraArgs, 'config': Config})
+
+
+class TestS3ReportUploader(unittest.TestCase):
+    """Test cases for the S3 report uploader."""
+
+    def setUp(self):
+        self.result = ValidationResult()
+        self.result.add_location(StorageLocation(
+            id="test-bucket",
+            name="test-bucket",
+            type=ResourceType.OBJECT_STORAGE,
+            provider="aws",
+            region="us-east-1",
+            encryption_type=EncryptionType.SERVER_SIDE,
+            encryption_details={'status': 'encrypted', 'type': 'server_side'},
+            compliant=True
+        ))
+
+    def test_upload_reports_without_local_files(self):
+        """Test that rendered reports are uploaded to the expected keys."""
+        s3 = LocalS3()
+        generator = ReportGenerator()
+
+        with S3ReportUploader(s3, 'report-bucket', max_concurrency=4) as uploader:
+            uploader.upload('report.json', generator.iter_json(self.result), 'application/json')
+            uploader.upload('summary.txt', generator.iter_summary(self.result), 'text/plain')
+            uris = uploader.wait()
+
+        self.assertEqual(uris, [
+            's3://report-bucket/reports/report.json',
+            's3://report-bucket/reports/summary.txt'
+        ])
+        report = json.loads(s3.objects[('report-bucket', 'reports/report.json')])
+        self.assertTrue(report['all_encrypted'])
+        self.assertEqual(report['storage_locations'][0]['id'], 'test-bucket')
+        self.assertIn(b'Overall Status: COMPLIANT', s3.objects[('report-bucket', 'reports/summary.txt')])
+
+        # Transfer manager is configured for concurrent multipart parts
+        config = s3.calls[0]['config']
+        self.assertEqual(config.max_concurrency, 4)
+        self.assertTrue(config.use_threads)
+
+    def test_upload_failure_is_raised_on_wait(self):
+        """Test that upload errors surface when waiting."""
+        s3 = LocalS3()
+        s3.upload_fileobj = lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("denied"))
+
+        with S3ReportUploader(s3, 'report-bucket') as uploader:
+            uploader.upload('report.json', '{}')
+            with self.assertRaises(RuntimeError):
+                uploader.wait()
+
+    def test_streamed_upload_is_read_in_pieces(self):
+        """Test that chunked reports are encoded as the upload reads them."""
+        s3 = LocalS3()
+        consumed = []
+
+        def chunks():
+            for index in range(1000):
+                consumed.append(index)
+                yield f"line {index} \u00e9\n"
+
+        def read_in_parts(fileobj, bucket, key, ExtraArgs=None, Config=None):
+            first = fileobj.read(100)
+            self.assertLess(len(consumed), 1000)
+            s3.objects[(bucket, key)] = first + fileobj.read()
+
+        s3.upload_fileobj = read_in_parts
+        with S3ReportUploader(s3, 'report-bucket') as uploader:
+            uploader.upload('report.txt', chunks())
+            uploader.wait()
+
+        expected = ''.join(f"line {index} \u00e9\n" for index in range(1000)).encode('utf-8')
+        self.assertEqual(s3.objects[('report-bucket', 'reports/report.txt')], expected)
+
+    def test_json_chunks_match_full_render(self):
+        """Test that the chunked JSON report equals a single json.dumps."""
+        generator = ReportGenerator()
+        self.result.add_error('missing-bucket', 'Bucket "missing-bucket"\nnot found')
+        self.result.not_validated = 2
+
+        for result in (ValidationResult(), self.result):
+            self.assertEqual(
+                ''.join(generator.iter_json(result)),
+                json.dumps(result.model_dump(), indent=2, default=str)
+            )
+
+    def test_render_matches_generated_file(self):
+        """Test that rendered CSV matches the file written by generate_csv."""
+        import tempfile
+        generator = ReportGenerator(output_dir=tempfile.mkdtemp())
+        path = generator.generate_csv(self.result, 'report.csv')
+
+        with open(path, newline='') as f:
+            self.assertEqual(f.read(), generator.render_csv(self.result))
+
+
+if __name__ == "__main__":
+    unittest.main()